@@ -224,6 +224,8 @@ def _setup(self, mock_mode=False) -> None:
                 model=self.config.model,
                 api_key=self.config.api_key,
                 api_base=self.config.api_base,
+                cache_dir=self.config.cache_dir,
+                cache_ttl=self.config.cache_ttl,
             )
 
         tool_executor = self._tool_registry.get_executor()
@@ -23,7 +23,7 @@
 """
 
 from framework.builder.query import BuilderQuery
-from framework.llm import AnthropicProvider, LLMProvider
+from framework.llm import LLMProvider
 from framework.runner import AgentOrchestrator, AgentRunner
 from framework.runtime.core import Runtime
 from framework.schemas.decision import Decision, DecisionEvaluation, Option, Outcome
@@ -68,3 +68,19 @@
     "ErrorCategory",
     "DebugTool",
 ]
+
+
+# Names served lazily by framework.llm, which owns the lazy-import table.
+_LAZY_LLM_EXPORTS = frozenset({"AnthropicProvider"})
+
+
+def __getattr__(name: str):
+    if name in _LAZY_LLM_EXPORTS:
+        from framework import llm
+
+        return getattr(llm, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_LLM_EXPORTS)
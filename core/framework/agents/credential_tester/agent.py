@@ -567,6 +567,8 @@ def _setup(self) -> None:
             model=self.config.model,
             api_key=self.config.api_key,
             api_base=self.config.api_base,
+            cache_dir=self.config.cache_dir,
+            cache_ttl=self.config.cache_ttl,
             **extra_kwargs,
         )
 
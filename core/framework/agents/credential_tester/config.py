@@ -5,7 +5,7 @@
 from framework.config import RuntimeConfig
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AgentMetadata:
     name: str = "Credential Tester"
     version: str = "1.0.0"
@@ -4,6 +4,8 @@
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from framework.config import get_llm_cache_dir, get_llm_cache_ttl
+
 
 def _load_preferred_model() -> str:
     """Load preferred model from ~/.hive/configuration.json."""
@@ -20,19 +22,21 @@ def _load_preferred_model() -> str:
     return "anthropic/claude-sonnet-4-20250514"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RuntimeConfig:
     model: str = field(default_factory=_load_preferred_model)
     temperature: float = 0.7
     max_tokens: int = 40000
     api_key: str | None = None
     api_base: str | None = None
+    cache_dir: str | None = field(default_factory=get_llm_cache_dir)
+    cache_ttl: float | None = field(default_factory=get_llm_cache_ttl)
 
 
 default_config = RuntimeConfig()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AgentMetadata:
     name: str = "Hive Coder"
     version: str = "1.0.0"
@@ -5,6 +5,7 @@
 helper functions.
 """
 
+import copy
 import json
 import os
 from dataclasses import dataclass, field
@@ -20,15 +21,31 @@
 HIVE_CONFIG_FILE = Path.home() / ".hive" / "configuration.json"
 
 
+# (path, mtime_ns, size) of the last parsed config file, and its contents.
+_hive_config_cache: tuple[tuple[str, int, int], dict[str, Any]] | None = None
+
+
 def get_hive_config() -> dict[str, Any]:
-    """Load hive configuration from ~/.hive/configuration.json."""
-    if not HIVE_CONFIG_FILE.exists():
-        return {}
+    """Load hive configuration from ~/.hive/configuration.json.
+
+    The parsed file is cached until its mtime or size changes, so the
+    helpers below (a single RuntimeConfig() consults five of them) share
+    one read instead of re-parsing the file each time.  Callers get their
+    own copy and may mutate it freely.
+    """
+    global _hive_config_cache
     try:
-        with open(HIVE_CONFIG_FILE, encoding="utf-8-sig") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
+        stat = HIVE_CONFIG_FILE.stat()
+    except OSError:
         return {}
+    stamp = (str(HIVE_CONFIG_FILE), stat.st_mtime_ns, stat.st_size)
+    if _hive_config_cache is None or _hive_config_cache[0] != stamp:
+        try:
+            with open(HIVE_CONFIG_FILE, encoding="utf-8-sig") as f:
+                _hive_config_cache = (stamp, json.load(f))
+        except (json.JSONDecodeError, OSError):
+            return {}
+    return copy.deepcopy(_hive_config_cache[1])
 
 
 # ---------------------------------------------------------------------------
@@ -49,6 +66,16 @@ def get_max_tokens() -> int:
     return get_hive_config().get("llm", {}).get("max_tokens", DEFAULT_MAX_TOKENS)
 
 
+def get_llm_cache_dir() -> str | None:
+    """Return the LLM response cache directory, or None when caching is off."""
+    return get_hive_config().get("llm", {}).get("cache_dir")
+
+
+def get_llm_cache_ttl() -> float | None:
+    """Return the maximum age in seconds of cached LLM responses, if bounded."""
+    return get_hive_config().get("llm", {}).get("cache_ttl")
+
+
 def get_api_key() -> str | None:
     """Return the API key, supporting env var, Claude Code subscription, Codex, and ZAI Code.
 
@@ -145,9 +172,13 @@ def get_llm_extra_kwargs() -> dict[str, Any]:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RuntimeConfig:
-    """Agent runtime configuration loaded from ~/.hive/configuration.json."""
+    """Agent runtime configuration loaded from ~/.hive/configuration.json.
+
+    Frozen because templates share a module-level ``default_config``
+    instance; build a new one (or use ``dataclasses.replace``) to override.
+    """
 
     model: str = field(default_factory=get_preferred_model)
     temperature: float = 0.7
@@ -155,3 +186,5 @@ class RuntimeConfig:
     api_key: str | None = field(default_factory=get_api_key)
     api_base: str | None = field(default_factory=get_api_base)
     extra_kwargs: dict[str, Any] = field(default_factory=get_llm_extra_kwargs)
+    cache_dir: str | None = field(default_factory=get_llm_cache_dir)
+    cache_ttl: float | None = field(default_factory=get_llm_cache_ttl)
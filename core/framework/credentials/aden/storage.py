@@ -129,7 +129,7 @@ def save(self, credential: CredentialObject) -> None:
         self._local.save(credential)
         self._cache_timestamps[credential.id] = datetime.now(UTC)
         self._index_provider(credential)
-        logger.debug(f"Cached credential '{credential.id}'")
+        logger.debug("Cached credential '%s'", credential.id)
 
     def load(self, credential_id: str) -> CredentialObject | None:
         """
@@ -190,7 +190,7 @@ def _load_by_id(self, credential_id: str) -> CredentialObject | None:
 
         # If we prefer local and have a fresh cache, use it
         if self._prefer_local and local_cred and self._is_cache_fresh(credential_id):
-            logger.debug(f"Using cached credential '{credential_id}'")
+            logger.debug("Using cached credential '%s'", credential_id)
             return local_cred
 
         # If nothing local, there's nothing to refresh from Aden.
@@ -204,7 +204,7 @@ def _load_by_id(self, credential_id: str) -> CredentialObject | None:
             aden_cred = self._aden_provider.fetch_from_aden(credential_id)
             if aden_cred:
                 self.save(aden_cred)
-                logger.debug(f"Fetched credential '{credential_id}' from Aden")
+                logger.debug("Fetched credential '%s' from Aden", credential_id)
                 return aden_cred
         except Exception as e:
             logger.warning(f"Failed to fetch '{credential_id}' from Aden: {e}")
@@ -299,7 +299,7 @@ def invalidate_cache(self, credential_id: str) -> None:
             credential_id: The credential identifier.
         """
         self._cache_timestamps.pop(credential_id, None)
-        logger.debug(f"Invalidated cache for '{credential_id}'")
+        logger.debug("Invalidated cache for '%s'", credential_id)
 
     def invalidate_all(self) -> None:
         """Invalidate all cache entries."""
@@ -329,7 +329,7 @@ def _index_provider(self, credential: CredentialObject) -> None:
                 self._provider_index[provider_name] = []
             if credential.id not in self._provider_index[provider_name]:
                 self._provider_index[provider_name].append(credential.id)
-            logger.debug(f"Indexed provider '{provider_name}' -> '{credential.id}'")
+            logger.debug("Indexed provider '%s' -> '%s'", provider_name, credential.id)
 
             # Index by alias for multi-account routing
             alias_key = credential.keys.get("_alias")
@@ -372,7 +372,7 @@ def rebuild_provider_index(self) -> int:
                 self._index_provider(cred)
                 if len(self._provider_index) > before:
                     indexed += 1
-        logger.debug(f"Rebuilt provider index with {indexed} mappings")
+        logger.debug("Rebuilt provider index with %s mappings", indexed)
         return indexed
 
     def sync_all_from_aden(self) -> int:
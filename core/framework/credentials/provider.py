@@ -189,7 +189,7 @@ def refresh(self, credential: CredentialObject) -> CredentialObject:
 
         Returns the credential unchanged.
         """
-        logger.debug(f"Static credential '{credential.id}' does not need refresh")
+        logger.debug("Static credential '%s' does not need refresh", credential.id)
         return credential
 
     def validate(self, credential: CredentialObject) -> bool:
@@ -188,7 +188,7 @@ def save(self, credential: CredentialObject) -> None:
 
         # Update index
         self._update_index(credential.id, "save", credential.credential_type.value)
-        logger.debug(f"Saved encrypted credential '{credential.id}'")
+        logger.debug("Saved encrypted credential '%s'", credential.id)
 
     def load(self, credential_id: str) -> CredentialObject | None:
         """Load and decrypt credential."""
@@ -218,7 +218,7 @@ def delete(self, credential_id: str) -> bool:
         if cred_path.exists():
             cred_path.unlink()
             self._update_index(credential_id, "delete")
-            logger.debug(f"Deleted credential '{credential_id}'")
+            logger.debug("Deleted credential '%s'", credential_id)
             return True
         return False
 
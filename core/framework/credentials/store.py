@@ -109,7 +109,7 @@ def register_provider(self, provider: CredentialProvider) -> None:
             provider: The provider to register
         """
         self._providers[provider.provider_id] = provider
-        logger.debug(f"Registered credential provider: {provider.provider_id}")
+        logger.debug("Registered credential provider: %s", provider.provider_id)
 
     def get_provider(self, provider_id: str) -> CredentialProvider | None:
         """
@@ -140,7 +140,7 @@ def save(self, credential: CredentialObject) -> None:
                 secret=data,
                 mount_point=self._mount,
             )
-            logger.debug(f"Saved credential '{credential.id}' to Vault at {path}")
+            logger.debug("Saved credential '%s' to Vault at %s", credential.id, path)
         except Exception as e:
             logger.error(f"Failed to save credential '{credential.id}' to Vault: {e}")
             raise
@@ -160,7 +160,7 @@ def load(self, credential_id: str) -> CredentialObject | None:
             # Check if it's a "not found" error
             error_str = str(e).lower()
             if "not found" in error_str or "404" in error_str:
-                logger.debug(f"Credential '{credential_id}' not found in Vault")
+                logger.debug("Credential '%s' not found in Vault", credential_id)
                 return None
             logger.error(f"Failed to load credential '{credential_id}' from Vault: {e}")
             raise
@@ -174,7 +174,7 @@ def delete(self, credential_id: str) -> bool:
                 path=path,
                 mount_point=self._mount,
             )
-            logger.debug(f"Deleted credential '{credential_id}' from Vault")
+            logger.debug("Deleted credential '%s' from Vault", credential_id)
             return True
         except Exception as e:
             error_str = str(e).lower()
@@ -144,6 +144,7 @@ def _try_extract_key(content: str, key: str) -> str | None:
     from framework.graph.node import find_json_object
 
     # 1. Whole message is JSON
+    parsed = None
     try:
         parsed = json.loads(content)
         if isinstance(parsed, dict) and key in parsed:
@@ -152,8 +153,9 @@ def _try_extract_key(content: str, key: str) -> str | None:
     except (json.JSONDecodeError, TypeError):
         pass
 
-    # 2. Embedded JSON via find_json_object
-    json_str = find_json_object(content)
+    # 2. Embedded JSON via find_json_object.  Skipped when the whole message
+    # already parsed as an object: the scan would just find and re-parse it.
+    json_str = None if isinstance(parsed, dict) else find_json_object(content)
     if json_str:
         try:
             parsed = json.loads(json_str)
@@ -35,6 +35,10 @@
 
 DEFAULT_MAX_TOKENS = 8192
 
+# Accepted AsyncEntryPointSpec values, checked by GraphSpec.validate().
+VALID_ISOLATION_LEVELS = frozenset({"isolated", "shared", "synchronized"})
+VALID_TRIGGER_TYPES = frozenset({"webhook", "api", "timer", "event", "manual"})
+
 
 class EdgeCondition(StrEnum):
     """When an edge should be traversed."""
@@ -513,12 +517,19 @@ def detect_fan_out_nodes(self) -> dict[str, list[str]]:
         Returns:
             Dict mapping source_node_id -> list of parallel target_node_ids
         """
+        # Group ON_SUCCESS edges by source in one pass over the edge list rather
+        # than filtering every edge once per node.
+        success_by_source: dict[str, list[EdgeSpec]] = {}
+        for edge in self.edges:
+            if edge.condition == EdgeCondition.ON_SUCCESS:
+                success_by_source.setdefault(edge.source, []).append(edge)
+
         fan_outs: dict[str, list[str]] = {}
         for node in self.nodes:
-            outgoing = self.get_outgoing_edges(node.id)
             # Fan-out: multiple edges with ON_SUCCESS condition
-            success_edges = [e for e in outgoing if e.condition == EdgeCondition.ON_SUCCESS]
+            success_edges = success_by_source.get(node.id, [])
             if len(success_edges) > 1:
+                success_edges = sorted(success_edges, key=lambda e: -e.priority)
                 fan_outs[node.id] = [e.target for e in success_edges]
         return fan_outs
 
@@ -575,8 +586,15 @@ def validate(self) -> list[str]:
         """Validate the graph structure."""
         errors = []
 
+        # Index nodes once so every reference check below is an O(1) lookup
+        # instead of a linear get_node() scan. setdefault keeps the first
+        # node for a duplicated id, matching get_node().
+        nodes_by_id: dict[str, Any] = {}
+        for node in self.nodes:
+            nodes_by_id.setdefault(node.id, node)
+
         # Check entry node exists
-        if not self.get_node(self.entry_node):
+        if self.entry_node not in nodes_by_id:
             errors.append(f"Entry node '{self.entry_node}' not found")
 
         # Check async entry points
@@ -588,39 +606,40 @@ def validate(self) -> list[str]:
             seen_entry_ids.add(entry_point.id)
 
             # Check entry node exists
-            if not self.get_node(entry_point.entry_node):
+            if entry_point.entry_node not in nodes_by_id:
                 errors.append(
                     f"Async entry point '{entry_point.id}' references "
                     f"missing node '{entry_point.entry_node}'"
                 )
 
             # Validate isolation level
-            valid_isolation = {"isolated", "shared", "synchronized"}
-            if entry_point.isolation_level not in valid_isolation:
+            if entry_point.isolation_level not in VALID_ISOLATION_LEVELS:
                 errors.append(
                     f"Async entry point '{entry_point.id}' has invalid isolation_level "
-                    f"'{entry_point.isolation_level}'. Valid: {valid_isolation}"
+                    f"'{entry_point.isolation_level}'. Valid: {sorted(VALID_ISOLATION_LEVELS)}"
                 )
 
             # Validate trigger type
-            valid_triggers = {"webhook", "api", "timer", "event", "manual"}
-            if entry_point.trigger_type not in valid_triggers:
+            if entry_point.trigger_type not in VALID_TRIGGER_TYPES:
                 errors.append(
                     f"Async entry point '{entry_point.id}' has invalid trigger_type "
-                    f"'{entry_point.trigger_type}'. Valid: {valid_triggers}"
+                    f"'{entry_point.trigger_type}'. Valid: {sorted(VALID_TRIGGER_TYPES)}"
                 )
 
         # Check terminal nodes exist
         for term in self.terminal_nodes:
-            if not self.get_node(term):
+            if term not in nodes_by_id:
                 errors.append(f"Terminal node '{term}' not found")
 
-        # Check edge references
+        # Check edge references, building the adjacency used by the
+        # reachability walk below in the same pass
+        successors: dict[str, list[str]] = {}
         for edge in self.edges:
-            if not self.get_node(edge.source):
+            if edge.source not in nodes_by_id:
                 errors.append(f"Edge '{edge.id}' references missing source '{edge.source}'")
-            if not self.get_node(edge.target):
+            if edge.target not in nodes_by_id:
                 errors.append(f"Edge '{edge.id}' references missing target '{edge.target}'")
+            successors.setdefault(edge.source, []).append(edge.target)
 
         # Check for unreachable nodes
         # Start with main entry node and all entry points (for pause/resume architecture)
@@ -641,10 +660,10 @@ def validate(self) -> list[str]:
             if current in reachable:
                 continue
             reachable.add(current)
-            for edge in self.get_outgoing_edges(current):
-                to_visit.append(edge.target)
+            to_visit.extend(successors.get(current, ()))
 
-        # Build set of async entry point nodes for quick lookup
+        # Build set of entry point nodes for quick lookup
+        entry_point_nodes = set(self.entry_points.values())
         async_entry_nodes = {ep.entry_node for ep in self.async_entry_points}
 
         for node in self.nodes:
@@ -653,7 +672,7 @@ def validate(self) -> list[str]:
                 # (pause/resume architecture and async entry points make reachable)
                 if (
                     node.id in self.pause_nodes
-                    or node.id in self.entry_points.values()
+                    or node.id in entry_point_nodes
                     or node.id in async_entry_nodes
                 ):
                     continue
@@ -663,9 +682,7 @@ def validate(self) -> list[str]:
         fan_outs = self.detect_fan_out_nodes()
         for source_id, targets in fan_outs.items():
             client_facing_targets = [
-                t
-                for t in targets
-                if self.get_node(t) and getattr(self.get_node(t), "client_facing", False)
+                t for t in targets if getattr(nodes_by_id.get(t), "client_facing", False)
             ]
             if len(client_facing_targets) > 1:
                 errors.append(
@@ -676,15 +693,12 @@ def validate(self) -> list[str]:
         # Output key overlap on parallel event_loop nodes
         for source_id, targets in fan_outs.items():
             event_loop_targets = [
-                t
-                for t in targets
-                if self.get_node(t) and getattr(self.get_node(t), "node_type", "") == "event_loop"
+                t for t in targets if getattr(nodes_by_id.get(t), "node_type", "") == "event_loop"
             ]
             if len(event_loop_targets) > 1:
                 seen_keys: dict[str, str] = {}
                 for node_id in event_loop_targets:
-                    node = self.get_node(node_id)
-                    for key in getattr(node, "output_keys", []):
+                    for key in getattr(nodes_by_id[node_id], "output_keys", []):
                         if key in seen_keys:
                             errors.append(
                                 f"Fan-out from '{source_id}': event_loop nodes "
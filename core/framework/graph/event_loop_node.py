@@ -14,14 +14,20 @@
 import asyncio
 import json
 import logging
+import re
 import time
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Literal, Protocol, runtime_checkable
 
+from pydantic import BaseModel
+
 from framework.graph.conversation import ConversationStore, NodeConversation
+from framework.graph.conversation_judge import evaluate_phase_completion
 from framework.graph.node import NodeContext, NodeProtocol, NodeResult
+from framework.graph.prompt_composer import _with_datetime, compose_system_prompt
+from framework.graph.validator import OutputValidator
 from framework.llm.provider import Tool, ToolResult, ToolUse
 from framework.llm.stream_events import (
     FinishEvent,
@@ -29,7 +35,7 @@
     TextDeltaEvent,
     ToolCallEvent,
 )
-from framework.runtime.event_bus import EventBus
+from framework.runtime.event_bus import AgentEvent, EventBus, EventType
 
 logger = logging.getLogger(__name__)
 
@@ -94,6 +100,12 @@ class LoopConfig:
     max_tool_result_chars: int = 3_000
     spillover_dir: str | None = None  # Path string; created on first use
 
+    # --- Input context management ---
+    # Upper bound on the characters of any single input value placed in the
+    # initial user message.  Longer values keep their head and tail (cut at
+    # line boundaries) with an elision note in between.  0 disables.
+    max_input_value_chars: int = 0
+
     # --- Stream retry (transient error recovery within EventLoopNode) ---
     # When _run_single_turn() raises a transient error (network, rate limit,
     # server error), retry up to this many times with exponential backoff
@@ -302,8 +314,6 @@ async def execute(self, ctx: NodeContext) -> NodeResult:
                 # runtime-injected context (e.g. worker identity) has changed.
                 # On resume, we rebuild identity + narrative + focus so the LLM
                 # understands the session history, not just the node directive.
-                from framework.graph.prompt_composer import compose_system_prompt
-
                 _current_prompt = compose_system_prompt(
                     identity_prompt=ctx.identity_prompt or None,
                     focus_prompt=ctx.node_spec.system_prompt,
@@ -318,8 +328,6 @@ async def execute(self, ctx: NodeContext) -> NodeResult:
                 _restored_tool_fingerprints = []
 
                 # Fresh conversation: either isolated mode or first node in continuous mode.
-                from framework.graph.prompt_composer import _with_datetime
-
                 system_prompt = _with_datetime(ctx.node_spec.system_prompt or "")
                 # Append connected accounts info if available
                 if ctx.accounts_prompt:
@@ -407,6 +415,10 @@ async def execute(self, ctx: NodeContext) -> NodeResult:
         # work (call tools) rather than auto-blocking again on text-only.
         _cf_expecting_work = False
 
+        # 5c. Pydantic output_model failures fed back to the LLM so far
+        # (bounded by NodeSpec.max_validation_retries).
+        _output_model_retries = 0
+
         # 6. Main loop
         for iteration in range(start_iteration, self._config.max_iterations):
             iter_start = time.time()
@@ -999,6 +1011,88 @@ async def execute(self, ctx: NodeContext) -> NodeResult:
                         )
                     continue
 
+                # Validate against output_model. On failure, feed the errors back
+                # into the same conversation so the LLM can repair its outputs
+                # without the whole node being retried from scratch.
+                output_model = ctx.node_spec.output_model
+                if output_model is not None:
+                    validator = OutputValidator()
+                    validation, _ = validator.validate_with_pydantic(
+                        accumulator.to_dict(), output_model
+                    )
+                    if not validation.success:
+                        if _output_model_retries < ctx.node_spec.max_validation_retries:
+                            _output_model_retries += 1
+                            logger.info(
+                                "[%s] iter=%d: output_model validation failed (retry %d/%d): %s",
+                                node_id,
+                                iteration,
+                                _output_model_retries,
+                                ctx.node_spec.max_validation_retries,
+                                validation.errors,
+                            )
+                            await conversation.add_user_message(
+                                self._format_output_model_feedback(
+                                    validation.errors, output_model, ctx.node_spec.output_keys
+                                )
+                            )
+                            _cf_expecting_work = True
+                            _retry_count += 1
+                            if ctx.runtime_logger:
+                                iter_latency_ms = int((time.time() - iter_start) * 1000)
+                                ctx.runtime_logger.log_step(
+                                    node_id=node_id,
+                                    node_type="event_loop",
+                                    step_index=iteration,
+                                    verdict="RETRY",
+                                    verdict_feedback=(
+                                        f"Output validation failed: {validation.errors}"
+                                    ),
+                                    tool_calls=logged_tool_calls,
+                                    llm_text=assistant_text,
+                                    input_tokens=turn_tokens.get("input", 0),
+                                    output_tokens=turn_tokens.get("output", 0),
+                                    latency_ms=iter_latency_ms,
+                                )
+                            continue
+
+                        # Exit point 5a: output_model validation retries exhausted
+                        await self._publish_loop_completed(
+                            stream_id, node_id, iteration + 1, execution_id
+                        )
+                        latency_ms = int((time.time() - start_time) * 1000)
+                        error = (
+                            f"Output failed {output_model.__name__} validation after "
+                            f"{_output_model_retries} retries: {validation.errors}"
+                        )
+                        if ctx.runtime_logger:
+                            ctx.runtime_logger.log_node_complete(
+                                node_id=node_id,
+                                node_name=ctx.node_spec.name,
+                                node_type="event_loop",
+                                success=False,
+                                error=error,
+                                total_steps=iteration + 1,
+                                tokens_used=total_input_tokens + total_output_tokens,
+                                input_tokens=total_input_tokens,
+                                output_tokens=total_output_tokens,
+                                latency_ms=latency_ms,
+                                exit_status="failure",
+                                accept_count=_accept_count,
+                                retry_count=_retry_count,
+                                escalate_count=_escalate_count,
+                                continue_count=_continue_count,
+                            )
+                        return NodeResult(
+                            success=False,
+                            error=error,
+                            output=accumulator.to_dict(),
+                            tokens_used=total_input_tokens + total_output_tokens,
+                            latency_ms=latency_ms,
+                            validation_errors=validation.errors,
+                            conversation=conversation if _is_continuous else None,
+                        )
+
                 # Exit point 5: Judge ACCEPT — log step + log_node_complete
                 # Write outputs to shared memory
                 for key, value in accumulator.to_dict().items():
@@ -1795,8 +1889,6 @@ def _handle_set_output(
         # Recover from truncated JSON (max_tokens hit mid-argument).
         # The _raw key is set by litellm when json.loads fails.
         if not key and "_raw" in tool_input:
-            import re
-
             raw = tool_input["_raw"]
             key_match = re.search(r'"key"\s*:\s*"(\w+)"', raw)
             if key_match:
@@ -1894,8 +1986,6 @@ async def _evaluate(
 
                 # Level 2: conversation-aware quality check (if success_criteria set)
                 if ctx.node_spec.success_criteria and ctx.llm:
-                    from framework.graph.conversation_judge import evaluate_phase_completion
-
                     verdict = await evaluate_phase_completion(
                         llm=ctx.llm,
                         conversation=conversation,
@@ -2020,18 +2110,49 @@ def _build_initial_message(self, ctx: NodeContext) -> str:
         # Include everything from input_data (flexible handoff)
         for key, value in ctx.input_data.items():
             if value is not None:
-                parts.append(f"{key}: {value}")
+                parts.append(f"{key}: {self._cap_input_value(key, value)}")
                 seen.add(key)
         # Fallback: check memory for declared input_keys not already covered
         for key in ctx.node_spec.input_keys:
             if key not in seen:
                 value = ctx.memory.read(key)
                 if value is not None:
-                    parts.append(f"{key}: {value}")
+                    parts.append(f"{key}: {self._cap_input_value(key, value)}")
         if ctx.goal_context:
             parts.append(f"\nGoal: {ctx.goal_context}")
         return "\n".join(parts) if parts else "Begin."
 
+    def _cap_input_value(self, key: str, value: Any) -> Any:
+        """Trim an oversized input value to ``max_input_value_chars``.
+
+        Keeps the head and tail halves, each cut back to the nearest line
+        boundary, so the model still sees how the input starts and ends.
+        """
+        limit = self._config.max_input_value_chars
+        if limit <= 0:
+            return value
+        text = str(value)
+        if len(text) <= limit:
+            return value
+
+        half = limit // 2
+        head_end = text.rfind("\n", 0, half)
+        if head_end <= 0:
+            head_end = half
+        tail_start = text.find("\n", len(text) - half)
+        if tail_start == -1:
+            tail_start = len(text) - half
+        else:
+            tail_start += 1
+        omitted = tail_start - head_end
+        logger.info(
+            "Input '%s' trimmed for context: %d → %d chars", key, len(text), len(text) - omitted
+        )
+        return (
+            f"{text[:head_end]}\n[... {omitted} chars omitted to fit context budget ...]\n"
+            f"{text[tail_start:]}"
+        )
+
     def _get_missing_output_keys(
         self,
         accumulator: OutputAccumulator,
@@ -2044,6 +2165,36 @@ def _get_missing_output_keys(
         skip = set(nullable_keys) if nullable_keys else set()
         return [k for k in output_keys if k not in skip and accumulator.get(k) is None]
 
+    @staticmethod
+    def _format_output_model_feedback(
+        errors: list[str],
+        output_model: type[BaseModel],
+        output_keys: list[str] | None,
+    ) -> str:
+        """Build the retry message for outputs that failed output_model validation.
+
+        Outputs only count when they arrive through set_output, so the message
+        names the failing keys and asks for set_output calls rather than a
+        JSON reply.  Errors are ``"<field path>: <msg> (type: ...)"`` strings
+        from OutputValidator; errors not tied to a field (model validators)
+        fall back to every declared output key.
+        """
+        failing = list(dict.fromkeys(e.split(":", 1)[0].split(".", 1)[0] for e in errors))
+        failing = [k for k in failing if k] or list(output_keys or [])
+        properties = output_model.model_json_schema().get("properties", {})
+        lines = [f"Your outputs failed {output_model.__name__} validation:"]
+        lines += [f"  - {e}" for e in errors]
+        lines.append("")
+        lines.append("Expected:")
+        for key in failing:
+            lines.append(f"  - {key}: {properties.get(key, {}).get('type', 'any')}")
+        lines.append("")
+        lines.append(
+            f"Call set_output again for: {', '.join(failing)}. Outputs are only "
+            "recorded through set_output — do not reply with the values as JSON text."
+        )
+        return "\n".join(lines)
+
     def _is_stalled(self, recent_responses: list[str]) -> bool:
         """Detect stall: N consecutive identical non-empty responses."""
         if len(recent_responses) < self._config.stall_detection_threshold:
@@ -2308,8 +2459,6 @@ async def _compact_tiered(
                         f"before={prune_before}% after={prune_after}%",
                     )
                 if self._event_bus:
-                    from framework.runtime.event_bus import AgentEvent, EventType
-
                     await self._event_bus.publish(
                         AgentEvent(
                             type=EventType.CONTEXT_COMPACTED,
@@ -2364,8 +2513,6 @@ async def _compact_tiered(
             )
 
         if self._event_bus:
-            from framework.runtime.event_bus import AgentEvent, EventType
-
             await self._event_bus.publish(
                 AgentEvent(
                     type=EventType.CONTEXT_COMPACTED,
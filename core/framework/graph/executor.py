@@ -458,8 +458,9 @@ async def execute(
         else:
             # Check if resuming from paused_at (session state resume)
             paused_at = session_state.get("paused_at") if session_state else None
-            node_ids = [n.id for n in graph.nodes]
-            self.logger.debug(f"paused_at={paused_at}, available node IDs={node_ids}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                node_ids = [n.id for n in graph.nodes]
+                self.logger.debug("paused_at=%s, available node IDs=%s", paused_at, node_ids)
 
             if paused_at and graph.get_node(paused_at) is not None:
                 # Resume from paused_at node directly (works for any node, not just pause_nodes)
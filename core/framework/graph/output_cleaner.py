@@ -15,6 +15,13 @@
 
 logger = logging.getLogger(__name__)
 
+# Compiled once: _heuristic_repair runs on every malformed node output.
+_FENCE_OPEN_RE = re.compile(r"^```(?:json)?\s*", re.MULTILINE)
+_FENCE_CLOSE_RE = re.compile(r"\s*```$", re.MULTILINE)
+_JSON_SPAN_RE = re.compile(r"(\{.*\}|\[.*\])", re.DOTALL)
+_PY_CONSTANT_RE = re.compile(r"\b(True|False|None)\b")
+_PY_CONSTANT_TO_JSON = {"True": "true", "False": "false", "None": "null"}
+
 
 def _heuristic_repair(text: str) -> dict | None:
     """
@@ -29,20 +36,19 @@ def _heuristic_repair(text: str) -> dict | None:
         return None
 
     # 1. Strip Markdown code blocks
-    text = re.sub(r"^```(?:json)?\s*", "", text, flags=re.MULTILINE)
-    text = re.sub(r"\s*```$", "", text, flags=re.MULTILINE)
+    if "```" in text:
+        text = _FENCE_OPEN_RE.sub("", text)
+        text = _FENCE_CLOSE_RE.sub("", text)
     text = text.strip()
 
     # 2. Find outermost JSON-like structure (greedy match)
-    match = re.search(r"(\{.*\}|\[.*\])", text, re.DOTALL)
+    match = _JSON_SPAN_RE.search(text)
     if match:
         candidate = match.group(1)
 
         # 3. Common fixes
         # Fix Python constants
-        candidate = re.sub(r"\bTrue\b", "true", candidate)
-        candidate = re.sub(r"\bFalse\b", "false", candidate)
-        candidate = re.sub(r"\bNone\b", "null", candidate)
+        candidate = _PY_CONSTANT_RE.sub(lambda m: _PY_CONSTANT_TO_JSON[m.group(1)], candidate)
 
         # 4. Attempt load
         try:
@@ -111,6 +117,7 @@ def __init__(self, config: CleansingConfig, llm_provider=None):
             try:
                 import os
 
+                from framework.config import get_llm_cache_dir, get_llm_cache_ttl
                 from framework.llm.litellm import LiteLLMProvider
 
                 api_key = os.environ.get("CEREBRAS_API_KEY")
@@ -118,6 +125,8 @@ def __init__(self, config: CleansingConfig, llm_provider=None):
                     self.llm = LiteLLMProvider(
                         api_key=api_key,
                         model=config.fast_model,
+                        cache_dir=get_llm_cache_dir(),
+                        cache_ttl=get_llm_cache_ttl(),
                     )
                     logger.info(f"✓ Initialized OutputCleaner with {config.fast_model}")
                 else:
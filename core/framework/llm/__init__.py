@@ -1,5 +1,8 @@
 """LLM provider abstraction."""
 
+import importlib
+
+from framework.llm.cache import ResponseCache
 from framework.llm.provider import LLMProvider, LLMResponse
 from framework.llm.stream_events import (
     FinishEvent,
@@ -16,6 +19,7 @@
 __all__ = [
     "LLMProvider",
     "LLMResponse",
+    "ResponseCache",
     "StreamEvent",
     "TextDeltaEvent",
     "TextEndEvent",
@@ -27,23 +31,23 @@
     "StreamErrorEvent",
 ]
 
-try:
-    from framework.llm.anthropic import AnthropicProvider  # noqa: F401
-
-    __all__.append("AnthropicProvider")
-except ImportError:
-    pass
-
-try:
-    from framework.llm.litellm import LiteLLMProvider  # noqa: F401
-
-    __all__.append("LiteLLMProvider")
-except ImportError:
-    pass
-
-try:
-    from framework.llm.mock import MockLLMProvider  # noqa: F401
-
-    __all__.append("MockLLMProvider")
-except ImportError:
-    pass
+# Concrete providers pull in litellm (hundreds of submodules) at import time.
+# Resolve them on first attribute access so importing the provider
+# abstractions, stream events or the graph package stays cheap.
+_LAZY_PROVIDERS = {
+    "AnthropicProvider": "framework.llm.anthropic",
+    "LiteLLMProvider": "framework.llm.litellm",
+    "MockLLMProvider": "framework.llm.mock",
+}
+
+__all__ += list(_LAZY_PROVIDERS)
+
+
+def __getattr__(name: str):
+    module_path = _LAZY_PROVIDERS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_path)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
@@ -1,6 +1,7 @@
 """Anthropic Claude LLM provider - backward compatible wrapper around LiteLLM."""
 
 import os
+from pathlib import Path
 from typing import Any
 
 from framework.llm.litellm import LiteLLMProvider
@@ -38,6 +39,8 @@ def __init__(
         self,
         api_key: str | None = None,
         model: str = "claude-haiku-4-5-20251001",
+        cache_dir: str | Path | None = None,
+        cache_ttl: float | None = None,
     ):
         """
         Initialize the Anthropic provider.
@@ -46,6 +49,8 @@ def __init__(
             api_key: Anthropic API key. If not provided, uses CredentialStoreAdapter
                      or ANTHROPIC_API_KEY env var.
             model: Model to use (default: claude-haiku-4-5-20251001)
+            cache_dir: Optional response cache directory (see LiteLLMProvider).
+            cache_ttl: Optional maximum age in seconds for cached responses.
         """
         # Delegate to LiteLLMProvider internally.
         self.api_key = api_key or _get_api_key_from_credential_store()
@@ -59,6 +64,8 @@ def __init__(
         self._provider = LiteLLMProvider(
             model=model,
             api_key=self.api_key,
+            cache_dir=cache_dir,
+            cache_ttl=cache_ttl,
         )
 
     def complete(
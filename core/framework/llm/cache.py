@@ -0,0 +1,135 @@
+"""Content-addressable response cache for LLM completions.
+
+Replaying the same prompt against the same model (development reruns,
+test replays, idempotent retries) pays the full LLM round-trip every
+time.  ``ResponseCache`` stores completed responses on disk keyed by a
+hash of everything that determines the output, so an identical request
+can short-circuit the network call entirely.
+
+The cache is opt-in: set ``cache_dir`` (and optionally ``cache_ttl`` to
+bound how long entries are served) in the ``llm`` section of
+``~/.hive/configuration.json``; ``RuntimeConfig`` picks them up and every
+``LiteLLMProvider`` construction site passes them through.  Only
+tool-free ``complete()``/``acomplete()`` calls that finish normally are
+cached.  ``stream()`` and requests that offer tools — which covers every
+EventLoopNode turn — always go to the model, because tool calls are not
+representable in the cached payload.
+"""
+
+import hashlib
+import json
+import logging
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from framework.llm.provider import LLMResponse
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cached payload layout or request-key derivation changes so
+# entries written by an older version are treated as misses.
+CACHE_VERSION = 2
+
+
+class ResponseCache:
+    """On-disk cache mapping a request key to a serialized ``LLMResponse``.
+
+    Entries live at ``{cache_dir}/{key}.json``.  An entry that cannot be
+    decoded or no longer matches the expected layout is evicted and
+    reported as a miss, so the caller refetches and rewrites it.
+
+    With ``ttl_seconds`` set, entries older than that are evicted on read
+    the same way, so model-side changes behind a stable model alias are
+    eventually picked up.  It comes from ``llm.cache_ttl`` in the hive
+    configuration via ``RuntimeConfig.cache_ttl``.
+    """
+
+    def __init__(self, cache_dir: str | Path, ttl_seconds: float | None = None):
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Derive a cache key from the request components.
+
+        Each part is serialized to canonical JSON and length-prefixed before
+        hashing, so adjacent parts can never be shifted into each other to
+        collide.  BLAKE2b is used for speed; keys are not a security
+        boundary, so a 128-bit digest is ample.
+        """
+        digest = hashlib.blake2b(f"v{CACHE_VERSION}".encode(), digest_size=16)
+        for part in parts:
+            encoded = json.dumps(part, sort_keys=True, default=str).encode()
+            digest.update(len(encoded).to_bytes(8, "big"))
+            digest.update(encoded)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> LLMResponse | None:
+        """Return the cached response for ``key``, or None on a miss."""
+        path = self._path(key)
+        try:
+            raw = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning("Failed to read LLM cache entry %s: %s", path, e)
+            return None
+
+        try:
+            entry = json.loads(raw)
+            if entry.get("version") != CACHE_VERSION:
+                raise ValueError(f"cache version {entry.get('version')!r}")
+            if self.ttl_seconds is not None:
+                created_at = datetime.fromisoformat(entry["created_at"])
+                age = (datetime.now(UTC) - created_at).total_seconds()
+                if age > self.ttl_seconds:
+                    raise ValueError(f"expired ({age:.0f}s old)")
+            data = entry["response"]
+            response = LLMResponse(
+                content=data["content"],
+                model=data["model"],
+                input_tokens=data.get("input_tokens", 0),
+                output_tokens=data.get("output_tokens", 0),
+                stop_reason=data.get("stop_reason", ""),
+            )
+            if not isinstance(response.content, str):
+                raise ValueError("content is not a string")
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.info("Evicting stale LLM cache entry %s: %s", path.name, e)
+            path.unlink(missing_ok=True)
+            return None
+
+        logger.debug("LLM cache hit: %s", key)
+        return response
+
+    def set(self, key: str, response: LLMResponse) -> None:
+        """Store ``response`` under ``key``.
+
+        Writes go through a temporary file and an atomic rename so a
+        concurrent reader never observes a half-written entry.
+        """
+        entry = {
+            "version": CACHE_VERSION,
+            "created_at": datetime.now(UTC).isoformat(),
+            "response": {
+                "content": response.content,
+                "model": response.model,
+                "input_tokens": response.input_tokens,
+                "output_tokens": response.output_tokens,
+                "stop_reason": response.stop_reason,
+            },
+        }
+        path = self._path(key)
+        tmp_path = path.with_name(f"{key}.{uuid.uuid4().hex}.tmp")
+        try:
+            tmp_path.write_text(json.dumps(entry), encoding="utf-8")
+            tmp_path.replace(path)
+        except OSError as e:
+            tmp_path.unlink(missing_ok=True)
+            logger.warning("Failed to write LLM cache entry %s: %s", path, e)
@@ -23,8 +23,16 @@
     litellm = None  # type: ignore[assignment]
     RateLimitError = Exception  # type: ignore[assignment, misc]
 
+from framework.llm.cache import ResponseCache
 from framework.llm.provider import LLMProvider, LLMResponse, Tool
-from framework.llm.stream_events import StreamEvent
+from framework.llm.stream_events import (
+    FinishEvent,
+    StreamErrorEvent,
+    StreamEvent,
+    TextDeltaEvent,
+    TextEndEvent,
+    ToolCallEvent,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -121,6 +129,9 @@ def _sync_wrapper(*args, _orig=original, **kwargs):
 # Directory for dumping failed requests
 FAILED_REQUESTS_DIR = Path.home() / ".hive" / "failed_requests"
 
+# Finish reasons of a complete reply; anything else (e.g. "length") is not cached.
+_CACHEABLE_STOP_REASONS = frozenset({"stop", "end_turn"})
+
 
 def _estimate_tokens(model: str, messages: list[dict]) -> tuple[int, str]:
     """Estimate token count for messages. Returns (token_count, method)."""
@@ -291,6 +302,9 @@ class LiteLLMProvider(LLMProvider):
             model="gpt-4o-mini",
             api_base="https://my-proxy.com/v1"
         )
+
+        # Reuse responses for identical requests across runs
+        provider = LiteLLMProvider(model="gpt-4o-mini", cache_dir="~/.hive/llm_cache")
     """
 
     def __init__(
@@ -298,6 +312,8 @@ def __init__(
         model: str = "gpt-4o-mini",
         api_key: str | None = None,
         api_base: str | None = None,
+        cache_dir: str | Path | None = None,
+        cache_ttl: float | None = None,
         **kwargs: Any,
     ):
         """
@@ -310,12 +326,23 @@ def __init__(
                      look for the appropriate env var (OPENAI_API_KEY,
                      ANTHROPIC_API_KEY, etc.)
             api_base: Custom API base URL (for proxies or local deployments)
+            cache_dir: Optional directory for a content-addressable response
+                       cache. Only complete()/acomplete() calls without tools
+                       are cached, and only when they finish normally;
+                       stream() and any request that offers tools always go
+                       to the network, so EventLoopNode turns are never
+                       served from the cache.
+            cache_ttl: Optional maximum age in seconds for cached responses.
+                       Older entries are refetched. Ignored without cache_dir.
             **kwargs: Additional arguments passed to litellm.completion()
         """
         self.model = model
         self.api_key = api_key
         self.api_base = api_base
         self.extra_kwargs = kwargs
+        self._response_cache = (
+            ResponseCache(cache_dir, ttl_seconds=cache_ttl) if cache_dir else None
+        )
         # The Codex ChatGPT backend (chatgpt.com/backend-api/codex) rejects
         # several standard OpenAI params: max_output_tokens, stream_options.
         self._codex_backend = bool(api_base and "chatgpt.com/backend-api/codex" in api_base)
@@ -443,6 +470,62 @@ def _completion_with_rate_limit_retry(
         # unreachable, but satisfies type checker
         raise RuntimeError("Exhausted rate limit retries")
 
+    def _cache_key(
+        self,
+        messages: list[dict[str, Any]],
+        system: str,
+        tools: list[Tool] | None,
+        max_tokens: int,
+        response_format: dict[str, Any] | None,
+        json_mode: bool,
+    ) -> str | None:
+        """Return the response-cache key for a request, or None if uncacheable."""
+        if self._response_cache is None or tools:
+            return None
+        # Auth headers rotate and do not affect the output — keep them out of the key.
+        extra = {k: v for k, v in self.extra_kwargs.items() if k != "extra_headers"}
+        return self._response_cache.make_key(
+            self.model,
+            self.api_base,
+            system,
+            messages,
+            max_tokens,
+            response_format,
+            json_mode,
+            extra,
+        )
+
+    @staticmethod
+    def _is_cacheable(result: LLMResponse) -> bool:
+        """Only store responses that finished normally.
+
+        A reply cut off at max_tokens (``length``) or stopped by a content
+        filter would otherwise be replayed for the cache's whole lifetime.
+        """
+        return bool(result.content) and result.stop_reason in _CACHEABLE_STOP_REASONS
+
+    def _mark_system_prompt_cacheable(self, full_messages: list[dict[str, Any]]) -> None:
+        """Mark the leading system prompt for Anthropic prompt caching.
+
+        The system prompt is the stable prefix of every turn in a node's
+        loop, so caching it lets Anthropic skip re-processing it on each
+        call.  Other providers either cache automatically or reject the
+        content-block form, so they are left untouched.
+        """
+        model = self.model.lower()
+        if not (model.startswith("anthropic/") or model.startswith("claude")):
+            return
+        if not full_messages or full_messages[0]["role"] != "system":
+            return
+        content = full_messages[0]["content"]
+        if not isinstance(content, str) or not content:
+            return
+        # Replace rather than mutate: the message may be the caller's own dict.
+        full_messages[0] = {
+            **full_messages[0],
+            "content": [{"type": "text", "text": content, "cache_control": {"type": "ephemeral"}}],
+        }
+
     def complete(
         self,
         messages: list[dict[str, Any]],
@@ -469,6 +552,12 @@ def complete(
                 )
             )
 
+        cache_key = self._cache_key(messages, system, tools, max_tokens, response_format, json_mode)
+        if cache_key is not None:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         # Prepare messages with system prompt
         full_messages = []
         if system:
@@ -484,6 +573,8 @@ def complete(
             else:
                 full_messages.insert(0, {"role": "system", "content": json_instruction.strip()})
 
+        self._mark_system_prompt_cacheable(full_messages)
+
         # Build kwargs
         kwargs: dict[str, Any] = {
             "model": self.model,
@@ -522,7 +613,7 @@ def complete(
         input_tokens = usage.prompt_tokens if usage else 0
         output_tokens = usage.completion_tokens if usage else 0
 
-        return LLMResponse(
+        result = LLMResponse(
             content=content,
             model=response.model or self.model,
             input_tokens=input_tokens,
@@ -530,6 +621,9 @@ def complete(
             stop_reason=response.choices[0].finish_reason or "",
             raw_response=response,
         )
+        if cache_key is not None and self._is_cacheable(result):
+            self._response_cache.set(cache_key, result)
+        return result
 
     # ------------------------------------------------------------------
     # Async variants — non-blocking on the event loop
@@ -653,6 +747,12 @@ async def acomplete(
         max_retries: int | None = None,
     ) -> LLMResponse:
         """Async version of complete(). Uses litellm.acompletion — non-blocking."""
+        cache_key = self._cache_key(messages, system, tools, max_tokens, response_format, json_mode)
+        if cache_key is not None:
+            cached = await asyncio.to_thread(self._response_cache.get, cache_key)
+            if cached is not None:
+                return cached
+
         # Codex ChatGPT backend requires streaming — route through stream() which
         # already handles Codex quirks and has proper tool call accumulation.
         if self._codex_backend:
@@ -664,7 +764,10 @@ async def acomplete(
                 response_format=response_format,
                 json_mode=json_mode,
             )
-            return await self._collect_stream_to_response(stream_iter)
+            result = await self._collect_stream_to_response(stream_iter)
+            if cache_key is not None and self._is_cacheable(result):
+                await asyncio.to_thread(self._response_cache.set, cache_key, result)
+            return result
 
         full_messages: list[dict[str, Any]] = []
         if system:
@@ -678,6 +781,8 @@ async def acomplete(
             else:
                 full_messages.insert(0, {"role": "system", "content": json_instruction.strip()})
 
+        self._mark_system_prompt_cacheable(full_messages)
+
         kwargs: dict[str, Any] = {
             "model": self.model,
             "messages": full_messages,
@@ -701,7 +806,7 @@ async def acomplete(
         input_tokens = usage.prompt_tokens if usage else 0
         output_tokens = usage.completion_tokens if usage else 0
 
-        return LLMResponse(
+        result = LLMResponse(
             content=content,
             model=response.model or self.model,
             input_tokens=input_tokens,
@@ -709,6 +814,9 @@ async def acomplete(
             stop_reason=response.choices[0].finish_reason or "",
             raw_response=response,
         )
+        if cache_key is not None and self._is_cacheable(result):
+            await asyncio.to_thread(self._response_cache.set, cache_key, result)
+        return result
 
     def _tool_to_openai_format(self, tool: Tool) -> dict[str, Any]:
         """Convert Tool to OpenAI function calling format."""
@@ -744,14 +852,6 @@ async def stream(
         with no content) are retried with exponential backoff, mirroring
         the retry behaviour of ``_completion_with_rate_limit_retry``.
         """
-        from framework.llm.stream_events import (
-            FinishEvent,
-            StreamErrorEvent,
-            TextDeltaEvent,
-            TextEndEvent,
-            ToolCallEvent,
-        )
-
         full_messages: list[dict[str, Any]] = []
         if system:
             full_messages.append({"role": "system", "content": system})
@@ -770,6 +870,8 @@ async def stream(
             else:
                 full_messages.insert(0, {"role": "system", "content": json_instruction.strip()})
 
+        self._mark_system_prompt_cacheable(full_messages)
+
         kwargs: dict[str, Any] = {
             "model": self.model,
             "messages": full_messages,
@@ -1000,13 +1102,6 @@ async def _collect_stream_to_response(
         Used by acomplete() to route through the unified streaming path so that
         all backends (including Codex) get proper tool call handling.
         """
-        from framework.llm.stream_events import (
-            FinishEvent,
-            StreamErrorEvent,
-            TextDeltaEvent,
-            ToolCallEvent,
-        )
-
         content = ""
         tool_calls: list[dict[str, Any]] = []
         input_tokens = 0
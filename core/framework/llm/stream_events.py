@@ -1,8 +1,9 @@
 """Stream event types for LLM streaming responses.
 
-Defines a discriminated union of frozen dataclasses representing every event
-a streaming LLM call can produce. These types form the contract between the
-LLM provider layer, EventLoopNode, event bus, persistence, and monitoring.
+Defines a discriminated union of frozen, slotted dataclasses representing
+every event a streaming LLM call can produce. These types form the contract
+between the LLM provider layer, EventLoopNode, event bus, persistence, and
+monitoring.
 """
 
 from __future__ import annotations
@@ -11,7 +12,7 @@
 from typing import Any, Literal
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TextDeltaEvent:
     """A chunk of text produced by the LLM."""
 
@@ -20,7 +21,7 @@ class TextDeltaEvent:
     snapshot: str = ""  # accumulated text so far
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TextEndEvent:
     """Signals that text generation is complete."""
 
@@ -28,7 +29,7 @@ class TextEndEvent:
     full_text: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolCallEvent:
     """The LLM has requested a tool call."""
 
@@ -38,7 +39,7 @@ class ToolCallEvent:
     tool_input: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolResultEvent:
     """Result of executing a tool call."""
 
@@ -48,14 +49,14 @@ class ToolResultEvent:
     is_error: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReasoningStartEvent:
     """The LLM has started a reasoning/thinking block."""
 
     type: Literal["reasoning_start"] = "reasoning_start"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReasoningDeltaEvent:
     """A chunk of reasoning/thinking content."""
 
@@ -63,7 +64,7 @@ class ReasoningDeltaEvent:
     content: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FinishEvent:
     """The LLM has finished generating."""
 
@@ -74,7 +75,7 @@ class FinishEvent:
     model: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StreamErrorEvent:
     """An error occurred during streaming."""
 
@@ -480,7 +480,7 @@ def disconnect(self) -> None:
                 except RuntimeError as e:
                     # Likely: loop stopped between is_running() check and run_coroutine_threadsafe()
                     cleanup_attempted = True
-                    logger.debug(f"Event loop stopped during async cleanup: {e}")
+                    logger.debug("Event loop stopped during async cleanup: %s", e)
                 except Exception as e:
                     # Cleanup was attempted but failed (e.g., error in _cleanup_stdio_async())
                     cleanup_attempted = True
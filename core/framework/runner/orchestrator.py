@@ -71,13 +71,21 @@ def __init__(
 
         # Auto-create LLM - LiteLLM auto-detects provider and API key from model name
         if self._llm is None:
-            from framework.config import get_api_base, get_api_key, get_llm_extra_kwargs
+            from framework.config import (
+                get_api_base,
+                get_api_key,
+                get_llm_cache_dir,
+                get_llm_cache_ttl,
+                get_llm_extra_kwargs,
+            )
             from framework.llm.litellm import LiteLLMProvider
 
             self._llm = LiteLLMProvider(
                 model=self._model,
                 api_key=get_api_key(),
                 api_base=get_api_base(),
+                cache_dir=get_llm_cache_dir(),
+                cache_ttl=get_llm_cache_ttl(),
                 **get_llm_extra_kwargs(),
             )
 
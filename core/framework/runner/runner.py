@@ -1038,6 +1038,11 @@ def _setup(self, event_bus=None) -> None:
             use_claude_code = llm_config.get("use_claude_code_subscription", False)
             use_codex = llm_config.get("use_codex_subscription", False)
             api_base = llm_config.get("api_base")
+            # Opt-in response cache for tool-free completions
+            cache_kwargs = {
+                "cache_dir": llm_config.get("cache_dir"),
+                "cache_ttl": llm_config.get("cache_ttl"),
+            }
 
             api_key = None
             if use_claude_code:
@@ -1062,6 +1067,7 @@ def _setup(self, event_bus=None) -> None:
                     api_key=api_key,
                     api_base=api_base,
                     extra_headers={"authorization": f"Bearer {api_key}"},
+                    **cache_kwargs,
                 )
             elif api_key and use_codex:
                 # OpenAI Codex subscription routes through the ChatGPT backend
@@ -1081,6 +1087,7 @@ def _setup(self, event_bus=None) -> None:
                     extra_headers=extra_headers,
                     store=False,
                     allowed_openai_params=["store"],
+                    **cache_kwargs,
                 )
             else:
                 # Local models (e.g. Ollama) don't need an API key
@@ -1088,6 +1095,7 @@ def _setup(self, event_bus=None) -> None:
                     self._llm = LiteLLMProvider(
                         model=self.model,
                         api_base=api_base,
+                        **cache_kwargs,
                     )
                 else:
                     # Fall back to environment variable
@@ -1100,13 +1108,17 @@ def _setup(self, event_bus=None) -> None:
                             model=self.model,
                             api_key=os.environ[api_key_env],
                             api_base=api_base,
+                            **cache_kwargs,
                         )
                     else:
                         # Fall back to credential store
                         api_key = self._get_api_key_from_credential_store()
                         if api_key:
                             self._llm = LiteLLMProvider(
-                                model=self.model, api_key=api_key, api_base=api_base
+                                model=self.model,
+                                api_key=api_key,
+                                api_base=api_base,
+                                **cache_kwargs,
                             )
                             # Set env var so downstream code (e.g. cleanup LLM in
                             # node._extract_json) can also find it
@@ -242,9 +242,15 @@ def get_executor(self) -> Callable[[ToolUse], ToolResult]:
         def _wrap_result(tool_use_id: str, result: Any) -> ToolResult:
             if isinstance(result, ToolResult):
                 return result
+            # Compact separators: the content goes straight into the LLM
+            # context, and MCP tool results already arrive as compact JSON.
             return ToolResult(
                 tool_use_id=tool_use_id,
-                content=json.dumps(result) if not isinstance(result, str) else result,
+                content=(
+                    json.dumps(result, separators=(",", ":"))
+                    if not isinstance(result, str)
+                    else result
+                ),
                 is_error=False,
             )
 
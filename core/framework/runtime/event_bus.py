@@ -266,7 +266,7 @@ def subscribe(
         )
 
         self._subscriptions[sub_id] = subscription
-        logger.debug(f"Subscription {sub_id} registered for {event_types}")
+        logger.debug("Subscription %s registered for %s", sub_id, event_types)
 
         return sub_id
 
@@ -282,7 +282,7 @@ def unsubscribe(self, subscription_id: str) -> bool:
         """
         if subscription_id in self._subscriptions:
             del self._subscriptions[subscription_id]
-            logger.debug(f"Subscription {subscription_id} removed")
+            logger.debug("Subscription %s removed", subscription_id)
             return True
         return False
 
@@ -446,7 +446,7 @@ async def execute(
         task = asyncio.create_task(self._run_execution(ctx))
         self._execution_tasks[execution_id] = task
 
-        logger.debug(f"Queued execution {execution_id} for stream {self.stream_id}")
+        logger.debug("Queued execution %s for stream %s", execution_id, self.stream_id)
         return execution_id
 
     async def _run_execution(self, ctx: ExecutionContext) -> None:
@@ -588,7 +588,7 @@ async def _run_execution(self, ctx: ExecutionContext) -> None:
                             correlation_id=ctx.correlation_id,
                         )
 
-                logger.debug(f"Execution {execution_id} completed: success={result.success}")
+                logger.debug("Execution %s completed: success=%s", execution_id, result.success)
 
             except asyncio.CancelledError:
                 # Execution was cancelled
@@ -775,7 +775,7 @@ async def _write_session_state(
 
             # Write state.json
             await self._session_store.write_state(execution_id, state)
-            logger.debug(f"Wrote state.json for session {execution_id} (status={status})")
+            logger.debug("Wrote state.json for session %s (status=%s)", execution_id, status)
 
         except Exception as e:
             # Log but don't fail the execution
@@ -148,7 +148,7 @@ def record_decision(
         self._decisions_by_id[key] = record
         self._total_decisions += 1
 
-        logger.debug(f"Recorded decision {decision.id} from {stream_id}/{execution_id}")
+        logger.debug("Recorded decision %s from %s/%s", decision.id, stream_id, execution_id)
 
     def record_outcome(
         self,
@@ -177,7 +177,7 @@ def record_outcome(
             else:
                 self._failed_outcomes += 1
 
-            logger.debug(f"Recorded outcome for {decision_id}: success={outcome.success}")
+            logger.debug("Recorded outcome for %s: success=%s", decision_id, outcome.success)
 
     def record_constraint_violation(
         self,
@@ -175,7 +175,7 @@ def end_run(
         # Save to storage asynchronously
         asyncio.create_task(self._save_run(execution_id, run))
 
-        logger.debug(f"Ended run {run.id} for execution {execution_id}: {status.value}")
+        logger.debug("Ended run %s for execution %s: %s", run.id, execution_id, status.value)
 
     async def _save_run(self, execution_id: str, run: Run) -> None:
         """Save run to storage and clean up."""
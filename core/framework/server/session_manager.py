@@ -90,6 +90,8 @@ async def _create_session_core(
             model=rc.model,
             api_key=rc.api_key,
             api_base=rc.api_base,
+            cache_dir=rc.cache_dir,
+            cache_ttl=rc.cache_ttl,
             **rc.extra_kwargs,
         )
         event_bus = EventBus()
@@ -64,7 +64,7 @@ def _write():
             with atomic_write(checkpoint_path) as f:
                 f.write(checkpoint.model_dump_json(indent=2))
 
-            logger.debug(f"Saved checkpoint {checkpoint.checkpoint_id}")
+            logger.debug("Saved checkpoint %s", checkpoint.checkpoint_id)
 
         # Write checkpoint file (blocking I/O in thread)
         await asyncio.to_thread(_write)
@@ -286,7 +286,7 @@ def _write(index: CheckpointIndex):
         # Write updated index
         await asyncio.to_thread(_write, index)
 
-        logger.debug(f"Updated index with checkpoint {checkpoint.checkpoint_id}")
+        logger.debug("Updated index with checkpoint %s", checkpoint.checkpoint_id)
 
     async def _update_index_remove(self, checkpoint_id: str) -> None:
         """
@@ -322,4 +322,4 @@ def _write(index: CheckpointIndex):
         # Write updated index
         await asyncio.to_thread(_write, index)
 
-        logger.debug(f"Removed checkpoint {checkpoint_id} from index")
+        logger.debug("Removed checkpoint %s from index", checkpoint_id)
@@ -361,7 +361,7 @@ async def _flush_batch(self, batch: list[tuple[str, Any]]) -> None:
         if not batch:
             return
 
-        logger.debug(f"Flushing batch of {len(batch)} items")
+        logger.debug("Flushing batch of %s items", len(batch))
 
         for item_type, item in batch:
             try:
@@ -96,7 +96,7 @@ def _write():
                 f.write(state.model_dump_json(indent=2))
 
         await asyncio.to_thread(_write)
-        logger.debug(f"Wrote state.json for session {session_id}")
+        logger.debug("Wrote state.json for session %s", session_id)
 
     async def read_state(self, session_id: str) -> SessionState | None:
         """
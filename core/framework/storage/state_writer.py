@@ -54,7 +54,7 @@ async def write_execution_state(
         if self.dual_write_enabled:
             try:
                 await self.new.write_state(session_id, state)
-                logger.debug(f"Wrote state.json for session {session_id}")
+                logger.debug("Wrote state.json for session %s", session_id)
             except Exception as e:
                 logger.error(f"Failed to write state.json for {session_id}: {e}")
                 # Don't fail - old format is still written
@@ -63,7 +63,7 @@ async def write_execution_state(
         try:
             run = self._convert_to_run(state)
             await self.old.save_run(run)
-            logger.debug(f"Wrote Run object for session {session_id}")
+            logger.debug("Wrote Run object for session %s", session_id)
         except Exception as e:
             logger.error(f"Failed to write Run object for {session_id}: {e}")
             # This is more critical - reraise if old format fails
@@ -12,6 +12,7 @@
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from pydantic import BaseModel
 
 from framework.graph.conversation import NodeConversation
 from framework.graph.event_loop_node import (
@@ -361,6 +362,106 @@ async def test_missing_keys_triggers_retry(self, runtime, node_spec, memory):
         assert result.success is True
         assert result.output["result"] == "done"
 
+    @pytest.mark.asyncio
+    async def test_output_model_failure_fed_back_then_accepted(self, runtime, memory):
+        """Invalid output against output_model -> errors fed back, LLM fixes it."""
+
+        class Score(BaseModel):
+            result: int
+
+        spec = NodeSpec(
+            id="scored",
+            name="Scored",
+            description="Node with an output model",
+            node_type="event_loop",
+            output_keys=["result"],
+            output_model=Score,
+        )
+        llm = MockStreamingLLM(
+            scenarios=[
+                tool_call_scenario("set_output", {"key": "result", "value": "high"}),
+                text_scenario("Done"),
+                tool_call_scenario("set_output", {"key": "result", "value": "7"}),
+                text_scenario("Fixed"),
+            ]
+        )
+
+        ctx = build_ctx(runtime, spec, memory, llm)
+        node = EventLoopNode(config=LoopConfig(max_iterations=10))
+        result = await node.execute(ctx)
+
+        assert result.success is True
+        assert result.output["result"] == 7
+        retry_messages = [str(m["content"]) for m in llm.stream_calls[2]["messages"]]
+        assert any("Call set_output again for: result" in c for c in retry_messages)
+        assert not any("respond with valid JSON" in c for c in retry_messages)
+
+    @pytest.mark.asyncio
+    async def test_output_model_json_text_reply_is_not_an_output(self, runtime, memory):
+        """Replying to the feedback with JSON text leaves outputs unchanged -> node fails."""
+
+        class Score(BaseModel):
+            result: int
+
+        spec = NodeSpec(
+            id="scored",
+            name="Scored",
+            description="Node with an output model",
+            node_type="event_loop",
+            output_keys=["result"],
+            output_model=Score,
+            max_validation_retries=1,
+        )
+        llm = MockStreamingLLM(
+            scenarios=[
+                tool_call_scenario("set_output", {"key": "result", "value": "high"}),
+                text_scenario("Done"),
+                text_scenario('{"result": 7}'),
+            ]
+        )
+
+        ctx = build_ctx(runtime, spec, memory, llm)
+        node = EventLoopNode(config=LoopConfig(max_iterations=10))
+        result = await node.execute(ctx)
+
+        assert result.success is False
+        assert result.output["result"] == "high"
+        assert "Score validation" in result.error
+        assert len(llm.stream_calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_output_model_retries_exhausted_fails(self, runtime, memory):
+        """Output still invalid after max_validation_retries -> node fails."""
+
+        class Score(BaseModel):
+            result: int
+
+        spec = NodeSpec(
+            id="scored",
+            name="Scored",
+            description="Node with an output model",
+            node_type="event_loop",
+            output_keys=["result"],
+            output_model=Score,
+            max_validation_retries=1,
+        )
+        llm = MockStreamingLLM(
+            scenarios=[
+                tool_call_scenario("set_output", {"key": "result", "value": "high"}),
+                text_scenario("Done"),
+                text_scenario("Still done"),
+            ]
+        )
+
+        ctx = build_ctx(runtime, spec, memory, llm)
+        node = EventLoopNode(config=LoopConfig(max_iterations=10))
+        result = await node.execute(ctx)
+
+        assert result.success is False
+        assert "Score validation" in result.error
+        assert result.validation_errors
+        assert len(llm.stream_calls) == 3
+
 
 # ===========================================================================
 # Stall detection
@@ -1248,6 +1349,36 @@ async def test_restore_from_real_store(self, tmp_path):
         assert acc.has_all_keys(["key1", "key2"]) is True
 
 
+class TestInputValueCap:
+    """max_input_value_chars trims oversized inputs in the initial message."""
+
+    def test_disabled_by_default(self, runtime, node_spec, memory):
+        ctx = build_ctx(runtime, node_spec, memory, None, input_data={"doc": "x" * 10_000})
+        node = EventLoopNode()
+
+        assert node._build_initial_message(ctx) == "doc: " + "x" * 10_000
+
+    def test_long_value_keeps_head_and_tail_on_line_boundaries(self, runtime, node_spec, memory):
+        lines = [f"line {i:04d}" for i in range(1000)]
+        ctx = build_ctx(runtime, node_spec, memory, None, input_data={"doc": "\n".join(lines)})
+        node = EventLoopNode(config=LoopConfig(max_input_value_chars=200))
+
+        message = node._build_initial_message(ctx)
+
+        assert message.startswith("doc: line 0000\n")
+        assert message.endswith("line 0999")
+        assert "chars omitted to fit context budget" in message
+        assert "line 0500" not in message
+        for line in message.splitlines():
+            assert line.startswith(("doc: line", "line", "[..."))
+
+    def test_short_value_untouched(self, runtime, node_spec, memory):
+        ctx = build_ctx(runtime, node_spec, memory, None, input_data={"n": 3})
+        node = EventLoopNode(config=LoopConfig(max_input_value_chars=200))
+
+        assert node._build_initial_message(ctx) == "n: 3"
+
+
 # ===========================================================================
 # Transient error retry (ITEM 2)
 # ===========================================================================
@@ -0,0 +1,24 @@
+"""Tests for the lazily exported names on the top-level framework package."""
+
+import pytest
+
+import framework
+
+
+class TestLazyAnthropicProvider:
+    """Tests for framework.AnthropicProvider lazy loading."""
+
+    def test_resolves_via_framework_llm(self):
+        from framework import llm
+        from framework.llm.anthropic import AnthropicProvider
+
+        assert framework.AnthropicProvider is AnthropicProvider
+        assert vars(llm)["AnthropicProvider"] is AnthropicProvider
+
+    def test_listed_in_dir(self):
+        assert "AnthropicProvider" in dir(framework)
+        assert "Runtime" in dir(framework)
+
+    def test_unknown_name_raises(self):
+        with pytest.raises(AttributeError, match="NotAThing"):
+            framework.NotAThing  # noqa: B018
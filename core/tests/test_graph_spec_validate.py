@@ -0,0 +1,112 @@
+"""Tests for GraphSpec.validate() structural checks."""
+
+from framework.graph.edge import AsyncEntryPointSpec, EdgeCondition, EdgeSpec, GraphSpec
+from framework.graph.node import NodeSpec
+
+
+def _node(node_id: str) -> NodeSpec:
+    return NodeSpec(id=node_id, name=node_id, description=f"Node {node_id}")
+
+
+def _edge(source: str, target: str, priority: int = 0) -> EdgeSpec:
+    return EdgeSpec(
+        id=f"{source}->{target}",
+        source=source,
+        target=target,
+        condition=EdgeCondition.ON_SUCCESS,
+        priority=priority,
+    )
+
+
+class TestGraphSpecValidate:
+    """Reference and reachability checks in GraphSpec.validate()."""
+
+    def test_valid_graph_has_no_errors(self):
+        graph = GraphSpec(
+            id="g",
+            goal_id="goal",
+            entry_node="a",
+            terminal_nodes=["c"],
+            nodes=[_node("a"), _node("b"), _node("c")],
+            edges=[_edge("a", "b"), _edge("b", "c")],
+        )
+
+        assert graph.validate() == []
+
+    def test_missing_references_are_reported(self):
+        graph = GraphSpec(
+            id="g",
+            goal_id="goal",
+            entry_node="missing-entry",
+            terminal_nodes=["missing-terminal"],
+            nodes=[_node("a")],
+            edges=[_edge("a", "ghost")],
+        )
+
+        errors = graph.validate()
+
+        assert "Entry node 'missing-entry' not found" in errors
+        assert "Terminal node 'missing-terminal' not found" in errors
+        assert "Edge 'a->ghost' references missing target 'ghost'" in errors
+
+    def test_unreachable_node_is_reported(self):
+        graph = GraphSpec(
+            id="g",
+            goal_id="goal",
+            entry_node="a",
+            nodes=[_node("a"), _node("b"), _node("orphan")],
+            edges=[_edge("a", "b")],
+        )
+
+        assert graph.validate() == ["Node 'orphan' is unreachable from entry"]
+
+    def test_entry_points_make_nodes_reachable(self):
+        graph = GraphSpec(
+            id="g",
+            goal_id="goal",
+            entry_node="a",
+            entry_points={"resume": "b"},
+            async_entry_points=[
+                AsyncEntryPointSpec(id="hook", name="Hook", entry_node="c", trigger_type="webhook")
+            ],
+            nodes=[_node("a"), _node("b"), _node("c"), _node("d")],
+            edges=[_edge("c", "d")],
+        )
+
+        assert graph.validate() == []
+
+    def test_invalid_async_entry_point_fields(self):
+        graph = GraphSpec(
+            id="g",
+            goal_id="goal",
+            entry_node="a",
+            async_entry_points=[
+                AsyncEntryPointSpec(
+                    id="ep",
+                    name="EP",
+                    entry_node="a",
+                    trigger_type="carrier-pigeon",
+                    isolation_level="leaky",
+                ),
+                AsyncEntryPointSpec(id="ep", name="EP again", entry_node="a"),
+            ],
+            nodes=[_node("a")],
+        )
+
+        errors = graph.validate()
+
+        assert any("invalid isolation_level 'leaky'" in e for e in errors)
+        assert any("invalid trigger_type 'carrier-pigeon'" in e for e in errors)
+        assert "Duplicate async entry point ID: 'ep'" in errors
+
+    def test_fan_out_targets_follow_edge_priority(self):
+        graph = GraphSpec(
+            id="g",
+            goal_id="goal",
+            entry_node="a",
+            nodes=[_node("a"), _node("b"), _node("c"), _node("d")],
+            edges=[_edge("a", "b"), _edge("a", "c", priority=5), _edge("c", "d")],
+        )
+
+        assert graph.detect_fan_out_nodes() == {"a": ["c", "b"]}
+        assert graph.validate() == []
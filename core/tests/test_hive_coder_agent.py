@@ -0,0 +1,65 @@
+"""Tests for HiveCoderAgent runtime setup."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from framework.agents.hive_coder.agent import HiveCoderAgent
+from framework.graph import NodeSpec
+from framework.graph.executor import ExecutionResult
+from framework.runner.tool_registry import ToolRegistry
+
+
+def _fake_runtime() -> MagicMock:
+    runtime = MagicMock()
+    runtime.is_running = False
+    runtime.start = AsyncMock()
+    runtime.stop = AsyncMock()
+    runtime.trigger_and_wait = AsyncMock(return_value=ExecutionResult(success=True))
+    return runtime
+
+
+class TestHiveCoderAgentSetup:
+    """Tests for reuse of per-agent setup across run() calls."""
+
+    @pytest.mark.asyncio
+    async def test_run_twice_reuses_tool_registry(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        agent = HiveCoderAgent()
+
+        with (
+            patch(
+                "framework.agents.hive_coder.agent.create_agent_runtime",
+                side_effect=lambda **kwargs: _fake_runtime(),
+            ) as create_runtime,
+            patch.object(ToolRegistry, "load_mcp_config") as load_mcp_config,
+        ):
+            await agent.run({"user_request": "first"}, mock_mode=True)
+            registry = agent._tool_registry
+            await agent.run({"user_request": "second"}, mock_mode=True)
+
+        assert create_runtime.call_count == 2
+        assert agent._tool_registry is registry
+        load_mcp_config.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_node_added_between_runs_reaches_second_graph(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        agent = HiveCoderAgent()
+        extra = NodeSpec(id="extra", name="Extra", description="Added after the first run")
+
+        with (
+            patch(
+                "framework.agents.hive_coder.agent.create_agent_runtime",
+                side_effect=lambda **kwargs: _fake_runtime(),
+            ) as create_runtime,
+            patch.object(ToolRegistry, "load_mcp_config"),
+        ):
+            await agent.run({"user_request": "first"}, mock_mode=True)
+            agent.nodes = list(agent.nodes)
+            agent.nodes.append(extra)
+            await agent.run({"user_request": "second"}, mock_mode=True)
+
+        first_graph, second_graph = (c.kwargs["graph"] for c in create_runtime.call_args_list)
+        assert "extra" not in {n.id for n in first_graph.nodes}
+        assert "extra" in {n.id for n in second_graph.nodes}
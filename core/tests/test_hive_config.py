@@ -0,0 +1,59 @@
+"""Tests for ~/.hive/configuration.json loading in framework.config."""
+
+import json
+import os
+
+import pytest
+
+from framework import config
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    path = tmp_path / "configuration.json"
+    monkeypatch.setattr(config, "HIVE_CONFIG_FILE", path)
+    monkeypatch.setattr(config, "_hive_config_cache", None)
+    return path
+
+
+class TestGetHiveConfig:
+    """Tests for get_hive_config caching."""
+
+    def test_missing_file_returns_empty(self, config_file):
+        assert config.get_hive_config() == {}
+
+    def test_invalid_json_returns_empty(self, config_file):
+        config_file.write_text("{not json")
+        assert config.get_hive_config() == {}
+
+    def test_reads_config(self, config_file):
+        config_file.write_text(json.dumps({"llm": {"provider": "openai", "model": "gpt-4o"}}))
+        assert config.get_preferred_model() == "openai/gpt-4o"
+
+    def test_repeated_reads_parse_file_once(self, config_file, monkeypatch):
+        config_file.write_text(json.dumps({"llm": {"max_tokens": 1234}}))
+        calls = []
+        real_load = json.load
+        monkeypatch.setattr(config.json, "load", lambda f: calls.append(1) or real_load(f))
+
+        for _ in range(3):
+            assert config.get_max_tokens() == 1234
+
+        assert len(calls) == 1
+
+    def test_file_change_is_picked_up(self, config_file):
+        config_file.write_text(json.dumps({"llm": {"max_tokens": 1}}))
+        assert config.get_max_tokens() == 1
+
+        config_file.write_text(json.dumps({"llm": {"max_tokens": 20000}}))
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert config.get_max_tokens() == 20000
+
+    def test_returned_dict_is_a_copy(self, config_file):
+        config_file.write_text(json.dumps({"llm": {"model": "m"}}))
+
+        config.get_hive_config()["llm"]["model"] = "mutated"
+
+        assert config.get_hive_config()["llm"]["model"] == "m"
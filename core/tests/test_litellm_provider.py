@@ -382,7 +382,54 @@ def test_anthropic_provider_passes_json_mode(self, mock_completion):
         # Should have JSON instruction in system prompt
         messages = call_kwargs["messages"]
         assert messages[0]["role"] == "system"
-        assert "Please respond with a valid JSON object" in messages[0]["content"]
+        assert "Please respond with a valid JSON object" in messages[0]["content"][0]["text"]
+
+
+class TestAnthropicPromptCaching:
+    """Test that the system prompt is marked cacheable for Anthropic models only."""
+
+    @staticmethod
+    def _mock_response():
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "ok"
+        mock_response.choices[0].finish_reason = "stop"
+        mock_response.model = "m"
+        mock_response.usage.prompt_tokens = 10
+        mock_response.usage.completion_tokens = 5
+        return mock_response
+
+    @patch("litellm.completion")
+    def test_anthropic_system_prompt_has_cache_control(self, mock_completion):
+        mock_completion.return_value = self._mock_response()
+        provider = LiteLLMProvider(model="anthropic/claude-3-haiku", api_key="k")
+
+        provider.complete(messages=[{"role": "user", "content": "hi"}], system="Be brief.")
+
+        system = mock_completion.call_args[1]["messages"][0]
+        assert system["role"] == "system"
+        assert system["content"] == [
+            {"type": "text", "text": "Be brief.", "cache_control": {"type": "ephemeral"}}
+        ]
+
+    @patch("litellm.completion")
+    def test_other_providers_keep_plain_system_prompt(self, mock_completion):
+        mock_completion.return_value = self._mock_response()
+        provider = LiteLLMProvider(model="gpt-4o-mini", api_key="k")
+
+        provider.complete(messages=[{"role": "user", "content": "hi"}], system="Be brief.")
+
+        assert mock_completion.call_args[1]["messages"][0]["content"] == "Be brief."
+
+    @patch("litellm.completion")
+    def test_caller_system_message_is_not_mutated(self, mock_completion):
+        mock_completion.return_value = self._mock_response()
+        provider = LiteLLMProvider(model="claude-3-haiku-20240307", api_key="k")
+        messages = [{"role": "system", "content": "Be brief."}, {"role": "user", "content": "hi"}]
+
+        provider.complete(messages=messages)
+
+        assert messages[0]["content"] == "Be brief."
 
 
 class TestComputeRetryDelay:
@@ -0,0 +1,217 @@
+"""Tests for the content-addressable LLM response cache."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from framework.llm.cache import ResponseCache
+from framework.llm.litellm import LiteLLMProvider
+from framework.llm.provider import LLMResponse, Tool
+
+
+def _mock_response(content: str = "cached answer", finish_reason: str = "stop") -> MagicMock:
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = content
+    response.choices[0].message.tool_calls = None
+    response.choices[0].finish_reason = finish_reason
+    response.model = "gpt-4o-mini"
+    response.usage.prompt_tokens = 10
+    response.usage.completion_tokens = 5
+    return response
+
+
+class TestResponseCache:
+    """Tests for ResponseCache storage semantics."""
+
+    def test_roundtrip(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        key = cache.make_key("model", "prompt")
+        cache.set(key, LLMResponse(content="hi", model="m", input_tokens=3, output_tokens=1))
+
+        hit = cache.get(key)
+
+        assert hit is not None
+        assert hit.content == "hi"
+        assert hit.input_tokens == 3
+        assert hit.raw_response is None
+
+    def test_miss_returns_none(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        assert cache.get(cache.make_key("nothing")) is None
+
+    def test_key_is_length_prefixed(self):
+        assert ResponseCache.make_key("ab", "c") != ResponseCache.make_key("a", "bc")
+
+    def test_key_ignores_dict_ordering(self):
+        assert ResponseCache.make_key({"a": 1, "b": 2}) == ResponseCache.make_key({"b": 2, "a": 1})
+
+    def test_stale_entry_is_evicted(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        key = cache.make_key("model", "prompt")
+        path = tmp_path / f"{key}.json"
+        path.write_text(json.dumps({"version": 1, "response": {"text": "old layout"}}))
+
+        assert cache.get(key) is None
+        assert not path.exists()
+
+    def test_expired_entry_is_evicted(self, tmp_path):
+        cache = ResponseCache(tmp_path, ttl_seconds=60)
+        key = cache.make_key("model", "prompt")
+        cache.set(key, LLMResponse(content="hi", model="m"))
+        path = tmp_path / f"{key}.json"
+        entry = json.loads(path.read_text())
+        entry["created_at"] = "2000-01-01T00:00:00+00:00"
+        path.write_text(json.dumps(entry))
+
+        assert cache.get(key) is None
+        assert not path.exists()
+
+    def test_fresh_entry_within_ttl_is_served(self, tmp_path):
+        cache = ResponseCache(tmp_path, ttl_seconds=60)
+        key = cache.make_key("model", "prompt")
+        cache.set(key, LLMResponse(content="hi", model="m"))
+
+        assert cache.get(key).content == "hi"
+
+    def test_corrupt_entry_is_evicted(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        key = cache.make_key("model", "prompt")
+        path = tmp_path / f"{key}.json"
+        path.write_text("{not json")
+
+        assert cache.get(key) is None
+        assert not path.exists()
+
+
+class TestLiteLLMProviderCache:
+    """Tests for LiteLLMProvider's opt-in response cache."""
+
+    @patch("litellm.completion")
+    def test_identical_request_served_from_cache(self, mock_completion, tmp_path):
+        mock_completion.return_value = _mock_response()
+        provider = LiteLLMProvider(model="gpt-4o-mini", api_key="k", cache_dir=tmp_path)
+        messages = [{"role": "user", "content": "Summarize this"}]
+
+        first = provider.complete(messages=messages, system="sys")
+        second = provider.complete(messages=messages, system="sys")
+
+        assert first.content == second.content == "cached answer"
+        mock_completion.assert_called_once()
+
+    @patch("litellm.completion")
+    def test_different_prompt_misses(self, mock_completion, tmp_path):
+        mock_completion.return_value = _mock_response()
+        provider = LiteLLMProvider(model="gpt-4o-mini", api_key="k", cache_dir=tmp_path)
+
+        provider.complete(messages=[{"role": "user", "content": "one"}])
+        provider.complete(messages=[{"role": "user", "content": "two"}])
+
+        assert mock_completion.call_count == 2
+
+    @patch("litellm.completion")
+    def test_tool_requests_bypass_cache(self, mock_completion, tmp_path):
+        mock_completion.return_value = _mock_response()
+        provider = LiteLLMProvider(model="gpt-4o-mini", api_key="k", cache_dir=tmp_path)
+        tools = [Tool(name="search", description="Search", parameters={})]
+        messages = [{"role": "user", "content": "find it"}]
+
+        provider.complete(messages=messages, tools=tools)
+        provider.complete(messages=messages, tools=tools)
+
+        assert mock_completion.call_count == 2
+        assert list(tmp_path.iterdir()) == []
+
+    @patch("litellm.completion")
+    def test_truncated_response_not_cached(self, mock_completion, tmp_path):
+        mock_completion.return_value = _mock_response("cut off mid-", finish_reason="length")
+        provider = LiteLLMProvider(model="gpt-4o-mini", api_key="k", cache_dir=tmp_path)
+        messages = [{"role": "user", "content": "write an essay"}]
+
+        provider.complete(messages=messages)
+        provider.complete(messages=messages)
+
+        assert mock_completion.call_count == 2
+        assert list(tmp_path.iterdir()) == []
+
+    @patch("litellm.completion")
+    def test_cache_disabled_by_default(self, mock_completion):
+        mock_completion.return_value = _mock_response()
+        provider = LiteLLMProvider(model="gpt-4o-mini", api_key="k")
+        messages = [{"role": "user", "content": "hello"}]
+
+        provider.complete(messages=messages)
+        provider.complete(messages=messages)
+
+        assert mock_completion.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("litellm.acompletion")
+    async def test_acomplete_shares_cache_with_complete(self, mock_acompletion, tmp_path):
+        async def async_return(*args, **kwargs):
+            return _mock_response("async answer")
+
+        mock_acompletion.side_effect = async_return
+        provider = LiteLLMProvider(model="gpt-4o-mini", api_key="k", cache_dir=tmp_path)
+        messages = [{"role": "user", "content": "hello"}]
+
+        await provider.acomplete(messages=messages)
+        with patch("litellm.completion") as mock_completion:
+            result = provider.complete(messages=messages)
+
+        assert result.content == "async answer"
+        mock_completion.assert_not_called()
+        mock_acompletion.assert_called_once()
+
+
+class TestCacheConfig:
+    """Tests for reading the cache settings from ~/.hive/configuration.json."""
+
+    def test_runtime_config_reads_cache_settings(self, tmp_path, monkeypatch):
+        from framework import config
+
+        config_file = tmp_path / "configuration.json"
+        config_file.write_text(
+            json.dumps({"llm": {"cache_dir": str(tmp_path / "cache"), "cache_ttl": 3600}})
+        )
+        monkeypatch.setattr(config, "HIVE_CONFIG_FILE", config_file)
+
+        rc = config.RuntimeConfig()
+
+        assert rc.cache_dir == str(tmp_path / "cache")
+        assert rc.cache_ttl == 3600
+
+    def test_cache_off_when_unconfigured(self, tmp_path, monkeypatch):
+        from framework import config
+
+        monkeypatch.setattr(config, "HIVE_CONFIG_FILE", tmp_path / "missing.json")
+
+        rc = config.RuntimeConfig()
+
+        assert rc.cache_dir is None
+        assert rc.cache_ttl is None
+
+    @patch("litellm.completion")
+    def test_configured_ttl_expires_provider_entries(self, mock_completion, tmp_path, monkeypatch):
+        from framework import config
+
+        cache_dir = tmp_path / "cache"
+        config_file = tmp_path / "configuration.json"
+        config_file.write_text(json.dumps({"llm": {"cache_dir": str(cache_dir), "cache_ttl": 60}}))
+        monkeypatch.setattr(config, "HIVE_CONFIG_FILE", config_file)
+        mock_completion.return_value = _mock_response()
+        rc = config.RuntimeConfig()
+        provider = LiteLLMProvider(
+            model="gpt-4o-mini", api_key="k", cache_dir=rc.cache_dir, cache_ttl=rc.cache_ttl
+        )
+        messages = [{"role": "user", "content": "hello"}]
+
+        provider.complete(messages=messages)
+        (entry_path,) = cache_dir.iterdir()
+        entry = json.loads(entry_path.read_text())
+        entry["created_at"] = "2000-01-01T00:00:00+00:00"
+        entry_path.write_text(json.dumps(entry))
+        provider.complete(messages=messages)
+
+        assert mock_completion.call_count == 2
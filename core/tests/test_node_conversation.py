@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
@@ -404,6 +405,15 @@ async def test_extract_embedded_json(self):
         )
         assert conv._extract_protected_values(conv.messages) == {"lead_score": "87"}
 
+    @pytest.mark.asyncio
+    async def test_whole_json_message_is_not_rescanned(self):
+        """A message that is itself a JSON object skips the embedded-JSON scan."""
+        conv = NodeConversation(output_keys=["score"])
+        await conv.add_assistant_message('{"other": 1}')
+        with patch("framework.graph.node.find_json_object") as mock_find:
+            assert conv._extract_protected_values(conv.messages) == {}
+        mock_find.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_extract_no_match_cases(self):
         """No extraction: user messages, no output_keys, key not found."""
@@ -16,6 +16,8 @@
     "framework.config.get_api_key": lambda: None,
     "framework.config.get_api_base": lambda: None,
     "framework.config.get_llm_extra_kwargs": lambda: {},
+    "framework.config.get_llm_cache_dir": lambda: None,
+    "framework.config.get_llm_cache_ttl": lambda: None,
 }
 
 
@@ -36,7 +38,11 @@ def test_auto_creates_litellm_provider_when_no_llm_passed(self):
             orchestrator = AgentOrchestrator()
 
             mock_init.assert_called_once_with(
-                model="claude-haiku-4-5-20251001", api_key=None, api_base=None
+                model="claude-haiku-4-5-20251001",
+                api_key=None,
+                api_base=None,
+                cache_dir=None,
+                cache_ttl=None,
             )
             assert orchestrator._llm is not None
 
@@ -46,7 +52,9 @@ def test_uses_custom_model_parameter(self):
         with patch.object(LiteLLMProvider, "__init__", return_value=None) as mock_init:
             AgentOrchestrator(model="gpt-4o")
 
-            mock_init.assert_called_once_with(model="gpt-4o", api_key=None, api_base=None)
+            mock_init.assert_called_once_with(
+                model="gpt-4o", api_key=None, api_base=None, cache_dir=None, cache_ttl=None
+            )
 
     @_patched
     def test_supports_openai_model_names(self):
@@ -54,7 +62,9 @@ def test_supports_openai_model_names(self):
         with patch.object(LiteLLMProvider, "__init__", return_value=None) as mock_init:
             orchestrator = AgentOrchestrator(model="gpt-4o-mini")
 
-            mock_init.assert_called_once_with(model="gpt-4o-mini", api_key=None, api_base=None)
+            mock_init.assert_called_once_with(
+                model="gpt-4o-mini", api_key=None, api_base=None, cache_dir=None, cache_ttl=None
+            )
             assert orchestrator._model == "gpt-4o-mini"
 
     @_patched
@@ -64,7 +74,11 @@ def test_supports_anthropic_model_names(self):
             orchestrator = AgentOrchestrator(model="claude-3-haiku-20240307")
 
             mock_init.assert_called_once_with(
-                model="claude-3-haiku-20240307", api_key=None, api_base=None
+                model="claude-3-haiku-20240307",
+                api_key=None,
+                api_base=None,
+                cache_dir=None,
+                cache_ttl=None,
             )
             assert orchestrator._model == "claude-3-haiku-20240307"
 
@@ -0,0 +1,29 @@
+"""Tests for the no-LLM JSON repair in framework.graph.output_cleaner."""
+
+from framework.graph.output_cleaner import _heuristic_repair
+
+
+class TestHeuristicRepair:
+    """Tests for _heuristic_repair."""
+
+    def test_plain_json(self):
+        assert _heuristic_repair('{"a": 1}') == {"a": 1}
+
+    def test_strips_markdown_fences(self):
+        text = '```json\n{"a": [1, 2]}\n```'
+        assert _heuristic_repair(text) == {"a": [1, 2]}
+
+    def test_extracts_json_from_surrounding_prose(self):
+        text = 'Here you go: {"ok": true} hope that helps'
+        assert _heuristic_repair(text) == {"ok": True}
+
+    def test_python_constants(self):
+        text = '{"a": True, "b": False, "c": None, "Trueish": "x"}'
+        assert _heuristic_repair(text) == {"a": True, "b": False, "c": None, "Trueish": "x"}
+
+    def test_single_quotes(self):
+        assert _heuristic_repair("{'a': 'b'}") == {"a": "b"}
+
+    def test_unrepairable_returns_none(self):
+        assert _heuristic_repair("no json here") is None
+        assert _heuristic_repair(None) is None
@@ -9,6 +9,7 @@
 import textwrap
 from pathlib import Path
 
+from framework.llm.provider import Tool, ToolUse
 from framework.runner.tool_registry import ToolRegistry
 
 
@@ -91,3 +92,17 @@ def tool_executor(tool_use: ToolUse) -> ToolResult:
     result = registered.executor({})
     assert isinstance(result, dict)
     assert result == {}
+
+
+def test_executor_serializes_dict_results_compactly():
+    """Dict results are JSON-encoded without padding before entering the context."""
+    registry = ToolRegistry()
+    registry.register(
+        "lookup",
+        Tool(name="lookup", description="Lookup", parameters={}),
+        lambda inputs: {"ids": [1, 2], "ok": True},
+    )
+
+    result = registry.get_executor()(ToolUse(id="t1", name="lookup", input={}))
+
+    assert result.content == '{"ids":[1,2],"ok":true}'
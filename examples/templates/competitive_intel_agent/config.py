@@ -6,7 +6,7 @@
 default_config: RuntimeConfig = RuntimeConfig()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AgentMetadata:
     """Metadata for the Competitive Intelligence Agent."""
 
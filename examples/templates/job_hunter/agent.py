@@ -197,11 +197,12 @@ def _setup(self, mock_mode=False) -> None:
         self._storage_path = Path.home() / ".hive" / "agents" / "job_hunter"
         self._storage_path.mkdir(parents=True, exist_ok=True)
 
-        self._tool_registry = ToolRegistry()
+        if self._tool_registry is None:
+            self._tool_registry = ToolRegistry()
 
-        mcp_config_path = Path(__file__).parent / "mcp_servers.json"
-        if mcp_config_path.exists():
-            self._tool_registry.load_mcp_config(mcp_config_path)
+            mcp_config_path = Path(__file__).parent / "mcp_servers.json"
+            if mcp_config_path.exists():
+                self._tool_registry.load_mcp_config(mcp_config_path)
 
         llm = None
         if not mock_mode:
@@ -209,6 +210,8 @@ def _setup(self, mock_mode=False) -> None:
                 model=self.config.model,
                 api_key=self.config.api_key,
                 api_base=self.config.api_base,
+                cache_dir=self.config.cache_dir,
+                cache_ttl=self.config.cache_ttl,
             )
 
         tool_executor = self._tool_registry.get_executor()
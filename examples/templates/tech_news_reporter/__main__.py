@@ -97,6 +97,8 @@ async def run_with_tui():
             model=agent.config.model,
             api_key=agent.config.api_key,
             api_base=agent.config.api_base,
+            cache_dir=agent.config.cache_dir,
+            cache_ttl=agent.config.cache_ttl,
         )
 
         tools = list(agent._tool_registry.get_tools().values())
@@ -7,7 +7,7 @@
 default_config = RuntimeConfig()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AgentMetadata:
     name: str = "Tech & AI News Reporter"
     version: str = "1.0.0"
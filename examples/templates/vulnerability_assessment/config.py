@@ -7,7 +7,7 @@
 default_config = RuntimeConfig()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AgentMetadata:
     name: str = "Passive Vulnerability Assessment"
     version: str = "2.0.0"
@@ -11,6 +11,7 @@
         env_var="SLACK_BOT_TOKEN",
         tools=[
             "slack_send_message",
+            "slack_send_messages",
             "slack_list_channels",
             "slack_get_channel_history",
             "slack_add_reaction",
@@ -1,5 +1,5 @@
 """Slack tool package for Aden Tools."""
 
-from .slack_tool import register_tools
+from .slack_tool import aclose_http_client, register_tools
 
-__all__ = ["register_tools"]
+__all__ = ["aclose_http_client", "register_tools"]
@@ -10,7 +10,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
+import json
+import logging
 import os
+import random
+import time
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 import httpx
@@ -19,8 +26,142 @@
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+logger = logging.getLogger(__name__)
+
 SLACK_API_BASE = "https://slack.com/api"
 
+# conversations.list paging.  Slack recommends pages of at most 200 and may
+# return short (even empty) pages before the cursor runs out, so listing walks
+# the cursor until the requested count is reached, bounded by wall-clock time.
+SLACK_PAGE_SIZE = 200
+MAX_PAGINATION_TIMEOUT_SECONDS = 30.0
+
+MAX_RETRIES = 3  # 4 total attempts on 429 / 5xx
+MAX_RETRY_WAIT = 60  # cap wait at 60s
+
+# Upper bound on in-flight Slack API requests across all tool calls.  Bursts
+# of parallel calls (e.g. an agent fanning out posts and history reads) would
+# otherwise run straight into Slack's per-method rate limits.
+DEFAULT_MAX_CONCURRENT_REQUESTS = 3
+
+
+def _max_concurrent_requests_from_env() -> int:
+    """Read SLACK_MAX_CONCURRENT_REQUESTS, falling back to the default if invalid.
+
+    Parsed at import time, so a bad value must not raise: that would take down
+    every tool in the MCP server, not just Slack.  Zero or negative values
+    would deadlock every call on the semaphore, so they are rejected too.
+    """
+    raw = os.getenv("SLACK_MAX_CONCURRENT_REQUESTS")
+    if raw is None:
+        return DEFAULT_MAX_CONCURRENT_REQUESTS
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value < 1:
+        logger.warning(
+            "Invalid SLACK_MAX_CONCURRENT_REQUESTS=%r; using %d",
+            raw,
+            DEFAULT_MAX_CONCURRENT_REQUESTS,
+        )
+        return DEFAULT_MAX_CONCURRENT_REQUESTS
+    return value
+
+
+SLACK_MAX_CONCURRENT_REQUESTS = _max_concurrent_requests_from_env()
+
+# One pooled HTTP client for the whole process.  A _SlackClient is created per
+# tool call, so module-level httpx requests would pay a fresh TCP + TLS
+# handshake to slack.com every time; the shared pool keeps connections alive.
+# API methods are requested by name ("chat.postMessage") relative to its
+# SLACK_API_BASE base_url; absolute URLs (file uploads) pass through as-is.
+# The pool and the request semaphore are bound to the event loop they were
+# created on, so new ones are made if the tools are driven from another loop
+# and the old pool is closed rather than left holding sockets.
+# With h2 installed (httpx[http2]) concurrent calls are multiplexed over one
+# HTTP/2 connection to slack.com instead of opening one connection each.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@dataclass(slots=True)
+class _LoopHttpState:
+    """The shared HTTP client and request semaphore for one event loop."""
+
+    loop: asyncio.AbstractEventLoop
+    client: httpx.AsyncClient
+    semaphore: asyncio.Semaphore
+    closer: asyncio.Task
+
+
+_http_state: _LoopHttpState | None = None
+
+
+async def _close_when_loop_stops(client: httpx.AsyncClient) -> None:
+    """Close ``client`` when this task is cancelled.
+
+    asyncio.run() (and asyncio.Runner) cancel leftover tasks before closing
+    the loop, so this closes the pool on the loop that owns its connections —
+    the only place it can be closed cleanly.
+    """
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await client.aclose()
+
+
+def _close_stale_client(loop: asyncio.AbstractEventLoop, closer: asyncio.Task) -> None:
+    """Close a client left behind by another event loop."""
+    if loop.is_closed():
+        return  # the loop cancelled ``closer`` (closing the pool) on shutdown
+    if loop.is_running():
+        loop.call_soon_threadsafe(closer.cancel)
+    # A stopped but unclosed loop cannot be driven from here; its closer task
+    # releases the pool when that loop is run again or shut down.
+
+
+def _get_http_client() -> tuple[httpx.AsyncClient, asyncio.Semaphore]:
+    """Return the shared HTTP client and request semaphore for the running loop.
+
+    Both are created together on first use (or after a loop change or close)
+    and always handed out as a pair, so they can never belong to different
+    loops.
+    """
+    global _http_state
+    loop = asyncio.get_running_loop()
+    state = _http_state
+    if state is None or state.client.is_closed or state.loop is not loop:
+        if state is not None:
+            _close_stale_client(state.loop, state.closer)
+        client = httpx.AsyncClient(
+            base_url=SLACK_API_BASE,
+            http2=_HTTP2_AVAILABLE,
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+        state = _http_state = _LoopHttpState(
+            loop=loop,
+            client=client,
+            semaphore=asyncio.Semaphore(max(1, SLACK_MAX_CONCURRENT_REQUESTS)),
+            closer=loop.create_task(_close_when_loop_stops(client)),
+        )
+    return state.client, state.semaphore
+
+
+async def aclose_http_client() -> None:
+    """Close the shared HTTP client, if one is open.
+
+    Called on server shutdown so pooled connections are released cleanly; a
+    later tool call simply creates a new client.
+    """
+    global _http_state
+    state, _http_state = _http_state, None
+    if state is None:
+        return
+    state.closer.cancel()
+    if not state.client.is_closed:
+        await state.client.aclose()
+
 
 class _SlackClient:
     """Internal client wrapping Slack Web API calls."""
@@ -28,22 +169,58 @@ class _SlackClient:
     def __init__(self, bot_token: str, user_token: str | None = None):
         self._token = bot_token
         self._user_token = user_token  # For search API which requires user tokens
-
-    @property
-    def _headers(self) -> dict[str, str]:
-        return {
-            "Authorization": f"Bearer {self._token}",
+        # Built once per client; every API method sends one of these unchanged.
+        self._headers = {
+            "Authorization": f"Bearer {bot_token}",
             "Content-Type": "application/json; charset=utf-8",
         }
-
-    def _user_headers(self) -> dict[str, str]:
-        """Headers using user token (for search API)."""
-        token = self._user_token or self._token
-        return {
-            "Authorization": f"Bearer {token}",
+        # Headers using user token (for search API)
+        self._user_headers = {
+            "Authorization": f"Bearer {user_token or bot_token}",
             "Content-Type": "application/json; charset=utf-8",
         }
 
+    async def _post(self, url: str, **kwargs: Any) -> httpx.Response:
+        """POST to the Slack API, waiting for a free request slot."""
+        return await self._request_with_retry("POST", url, **kwargs)
+
+    async def _get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """GET from the Slack API, waiting for a free request slot."""
+        return await self._request_with_retry("GET", url, **kwargs)
+
+    async def _request_with_retry(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request, retrying on rate limits and transient server errors.
+
+        429 responses are retried after Slack's Retry-After delay. 5xx
+        responses are retried with jittered exponential backoff, but only
+        for GETs: a failed write may still have been applied, and replaying
+        chat.postMessage would post the message twice.  The request slot is
+        held across retries so backing off does not let other calls pile
+        onto a rate-limited workspace.
+
+        Requests are sent with the bot-token headers unless ``headers`` is
+        given; the timeout defaults to the shared client's 30s.
+        """
+        kwargs.setdefault("headers", self._headers)
+        http, semaphore = _get_http_client()
+        send = http.get if method == "GET" else http.post
+        async with semaphore:
+            for attempt in range(MAX_RETRIES + 1):
+                response = await send(url, **kwargs)
+                if attempt == MAX_RETRIES:
+                    break
+                if response.status_code == 429:
+                    try:
+                        wait = float(response.headers.get("Retry-After", 2**attempt))
+                    except ValueError:
+                        wait = 2**attempt
+                elif response.status_code >= 500 and method == "GET":
+                    wait = 0.5 * 2**attempt + random.uniform(0, 0.25)
+                else:
+                    break
+                await asyncio.sleep(min(wait, MAX_RETRY_WAIT))
+        return response
+
     def _handle_response(self, response: httpx.Response) -> dict[str, Any]:
         """Handle Slack API response format."""
         if response.status_code != 200:
@@ -70,7 +247,7 @@ def _handle_response(self, response: httpx.Response) -> dict[str, Any]:
 
         return data
 
-    def post_message(
+    async def post_message(
         self,
         channel: str,
         text: str,
@@ -87,15 +264,13 @@ def post_message(
         if blocks:
             body["blocks"] = blocks
 
-        response = httpx.post(
-            f"{SLACK_API_BASE}/chat.postMessage",
-            headers=self._headers,
+        response = await self._post(
+            "chat.postMessage",
             json=body,
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def list_conversations(
+    async def list_conversations(
         self,
         types: str = "public_channel,private_channel",
         limit: int = 100,
@@ -110,15 +285,13 @@ def list_conversations(
         if cursor:
             params["cursor"] = cursor
 
-        response = httpx.get(
-            f"{SLACK_API_BASE}/conversations.list",
-            headers=self._headers,
+        response = await self._get(
+            "conversations.list",
             params=params,
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def get_history(
+    async def get_history(
         self,
         channel: str,
         limit: int = 20,
@@ -135,15 +308,13 @@ def get_history(
         if latest:
             params["latest"] = latest
 
-        response = httpx.get(
-            f"{SLACK_API_BASE}/conversations.history",
-            headers=self._headers,
+        response = await self._get(
+            "conversations.history",
             params=params,
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def add_reaction(
+    async def add_reaction(
         self,
         channel: str,
         timestamp: str,
@@ -155,34 +326,28 @@ def add_reaction(
             "timestamp": timestamp,
             "name": name.strip(":"),  # Remove colons if present
         }
-        response = httpx.post(
-            f"{SLACK_API_BASE}/reactions.add",
-            headers=self._headers,
+        response = await self._post(
+            "reactions.add",
             json=body,
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def get_user_info(self, user_id: str) -> dict[str, Any]:
+    async def get_user_info(self, user_id: str) -> dict[str, Any]:
         """Get information about a user."""
-        response = httpx.get(
-            f"{SLACK_API_BASE}/users.info",
-            headers=self._headers,
+        response = await self._get(
+            "users.info",
             params={"user": user_id},
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def auth_test(self) -> dict[str, Any]:
+    async def auth_test(self) -> dict[str, Any]:
         """Test authentication and get bot info."""
-        response = httpx.post(
-            f"{SLACK_API_BASE}/auth.test",
-            headers=self._headers,
-            timeout=30.0,
+        response = await self._post(
+            "auth.test",
         )
         return self._handle_response(response)
 
-    def update_message(
+    async def update_message(
         self,
         channel: str,
         ts: str,
@@ -198,25 +363,21 @@ def update_message(
         if blocks:
             body["blocks"] = blocks
 
-        response = httpx.post(
-            f"{SLACK_API_BASE}/chat.update",
-            headers=self._headers,
+        response = await self._post(
+            "chat.update",
             json=body,
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def delete_message(self, channel: str, ts: str) -> dict[str, Any]:
+    async def delete_message(self, channel: str, ts: str) -> dict[str, Any]:
         """Delete a message."""
-        response = httpx.post(
-            f"{SLACK_API_BASE}/chat.delete",
-            headers=self._headers,
+        response = await self._post(
+            "chat.delete",
             json={"channel": channel, "ts": ts},
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def schedule_message(
+    async def schedule_message(
         self,
         channel: str,
         text: str,
@@ -232,49 +393,41 @@ def schedule_message(
         if thread_ts:
             body["thread_ts"] = thread_ts
 
-        response = httpx.post(
-            f"{SLACK_API_BASE}/chat.scheduleMessage",
-            headers=self._headers,
+        response = await self._post(
+            "chat.scheduleMessage",
             json=body,
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def create_channel(
+    async def create_channel(
         self,
         name: str,
         is_private: bool = False,
     ) -> dict[str, Any]:
         """Create a new channel."""
-        response = httpx.post(
-            f"{SLACK_API_BASE}/conversations.create",
-            headers=self._headers,
+        response = await self._post(
+            "conversations.create",
             json={"name": name, "is_private": is_private},
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def archive_channel(self, channel: str) -> dict[str, Any]:
+    async def archive_channel(self, channel: str) -> dict[str, Any]:
         """Archive a channel."""
-        response = httpx.post(
-            f"{SLACK_API_BASE}/conversations.archive",
-            headers=self._headers,
+        response = await self._post(
+            "conversations.archive",
             json={"channel": channel},
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def invite_to_channel(self, channel: str, users: str) -> dict[str, Any]:
+    async def invite_to_channel(self, channel: str, users: str) -> dict[str, Any]:
         """Invite users to a channel (comma-separated user IDs)."""
-        response = httpx.post(
-            f"{SLACK_API_BASE}/conversations.invite",
-            headers=self._headers,
+        response = await self._post(
+            "conversations.invite",
             json={"channel": channel, "users": users},
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def remove_reaction(
+    async def remove_reaction(
         self,
         channel: str,
         timestamp: str,
@@ -286,25 +439,21 @@ def remove_reaction(
             "timestamp": timestamp,
             "name": name.strip(":"),
         }
-        response = httpx.post(
-            f"{SLACK_API_BASE}/reactions.remove",
-            headers=self._headers,
+        response = await self._post(
+            "reactions.remove",
             json=body,
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def list_users(self, limit: int = 100) -> dict[str, Any]:
+    async def list_users(self, limit: int = 100) -> dict[str, Any]:
         """List users in the workspace."""
-        response = httpx.get(
-            f"{SLACK_API_BASE}/users.list",
-            headers=self._headers,
+        response = await self._get(
+            "users.list",
             params={"limit": min(limit, 1000)},
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def upload_file(
+    async def upload_file(
         self,
         channels: str,
         content: str,
@@ -324,11 +473,9 @@ def upload_file(
             "filename": filename,
             "length": length,
         }
-        url_response = httpx.get(
-            f"{SLACK_API_BASE}/files.getUploadURLExternal",
-            headers=self._headers,
+        url_response = await self._get(
+            "files.getUploadURLExternal",
             params=params,
-            timeout=30.0,
         )
         url_result = self._handle_response(url_response)
         if "error" in url_result:
@@ -341,7 +488,7 @@ def upload_file(
             return {"error": "Failed to get upload URL from Slack"}
 
         # Step 2: Upload file content to the URL
-        upload_response = httpx.post(
+        upload_response = await self._post(
             upload_url,
             content=content_bytes,
             headers={"Content-Type": "application/octet-stream"},
@@ -359,11 +506,9 @@ def upload_file(
         if initial_comment:
             complete_body["initial_comment"] = initial_comment
 
-        complete_response = httpx.post(
-            f"{SLACK_API_BASE}/files.completeUploadExternal",
-            headers=self._headers,
+        complete_response = await self._post(
+            "files.completeUploadExternal",
             json=complete_body,
-            timeout=30.0,
         )
         result = self._handle_response(complete_response)
         if "error" in result:
@@ -375,19 +520,17 @@ def upload_file(
             return {"ok": True, "file": files[0]}
         return {"ok": True}
 
-    def set_channel_topic(self, channel: str, topic: str) -> dict[str, Any]:
+    async def set_channel_topic(self, channel: str, topic: str) -> dict[str, Any]:
         """Set the topic for a channel."""
-        response = httpx.post(
-            f"{SLACK_API_BASE}/conversations.setTopic",
-            headers=self._headers,
+        response = await self._post(
+            "conversations.setTopic",
             json={"channel": channel, "topic": topic},
-            timeout=30.0,
         )
         return self._handle_response(response)
 
     # --- Advanced Features ---
 
-    def search_messages(
+    async def search_messages(
         self,
         query: str,
         count: int = 20,
@@ -399,9 +542,9 @@ def search_messages(
         Set SLACK_USER_TOKEN environment variable for this to work.
         """
         # Use user token if available (search requires user token)
-        headers = self._user_headers()
-        response = httpx.get(
-            f"{SLACK_API_BASE}/search.messages",
+        headers = self._user_headers
+        response = await self._get(
+            "search.messages",
             headers=headers,
             params={
                 "query": query,
@@ -409,7 +552,6 @@ def search_messages(
                 "sort": sort,
                 "sort_dir": "desc",
             },
-            timeout=30.0,
         )
         result = self._handle_response(response)
         # Add helpful hint if token type error
@@ -418,56 +560,48 @@ def search_messages(
             result["help"] = "Get user token from Slack App > OAuth > User OAuth Token"
         return result
 
-    def get_thread_replies(
+    async def get_thread_replies(
         self,
         channel: str,
         thread_ts: str,
         limit: int = 50,
     ) -> dict[str, Any]:
         """Get all replies in a thread."""
-        response = httpx.get(
-            f"{SLACK_API_BASE}/conversations.replies",
-            headers=self._headers,
+        response = await self._get(
+            "conversations.replies",
             params={
                 "channel": channel,
                 "ts": thread_ts,
                 "limit": min(limit, 1000),
             },
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def pin_message(self, channel: str, timestamp: str) -> dict[str, Any]:
+    async def pin_message(self, channel: str, timestamp: str) -> dict[str, Any]:
         """Pin a message to a channel."""
-        response = httpx.post(
-            f"{SLACK_API_BASE}/pins.add",
-            headers=self._headers,
+        response = await self._post(
+            "pins.add",
             json={"channel": channel, "timestamp": timestamp},
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def unpin_message(self, channel: str, timestamp: str) -> dict[str, Any]:
+    async def unpin_message(self, channel: str, timestamp: str) -> dict[str, Any]:
         """Unpin a message from a channel."""
-        response = httpx.post(
-            f"{SLACK_API_BASE}/pins.remove",
-            headers=self._headers,
+        response = await self._post(
+            "pins.remove",
             json={"channel": channel, "timestamp": timestamp},
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def list_pins(self, channel: str) -> dict[str, Any]:
+    async def list_pins(self, channel: str) -> dict[str, Any]:
         """List pinned items in a channel."""
-        response = httpx.get(
-            f"{SLACK_API_BASE}/pins.list",
-            headers=self._headers,
+        response = await self._get(
+            "pins.list",
             params={"channel": channel},
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def add_bookmark(
+    async def add_bookmark(
         self,
         channel: str,
         title: str,
@@ -484,66 +618,56 @@ def add_bookmark(
         if emoji:
             body["emoji"] = emoji
 
-        response = httpx.post(
-            f"{SLACK_API_BASE}/bookmarks.add",
-            headers=self._headers,
+        response = await self._post(
+            "bookmarks.add",
             json=body,
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def list_scheduled_messages(self, channel: str | None = None) -> dict[str, Any]:
+    async def list_scheduled_messages(self, channel: str | None = None) -> dict[str, Any]:
         """List scheduled messages."""
         params: dict[str, Any] = {}
         if channel:
             params["channel"] = channel
 
-        response = httpx.post(
-            f"{SLACK_API_BASE}/chat.scheduledMessages.list",
-            headers=self._headers,
+        response = await self._post(
+            "chat.scheduledMessages.list",
             json=params,
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def delete_scheduled_message(
+    async def delete_scheduled_message(
         self,
         channel: str,
         scheduled_message_id: str,
     ) -> dict[str, Any]:
         """Delete a scheduled message."""
-        response = httpx.post(
-            f"{SLACK_API_BASE}/chat.deleteScheduledMessage",
-            headers=self._headers,
+        response = await self._post(
+            "chat.deleteScheduledMessage",
             json={
                 "channel": channel,
                 "scheduled_message_id": scheduled_message_id,
             },
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def open_dm(self, users: str) -> dict[str, Any]:
+    async def open_dm(self, users: str) -> dict[str, Any]:
         """Open a DM or multi-person DM. Returns channel ID."""
-        response = httpx.post(
-            f"{SLACK_API_BASE}/conversations.open",
-            headers=self._headers,
+        response = await self._post(
+            "conversations.open",
             json={"users": users},
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def get_permalink(self, channel: str, message_ts: str) -> dict[str, Any]:
+    async def get_permalink(self, channel: str, message_ts: str) -> dict[str, Any]:
         """Get a permanent link to a message."""
-        response = httpx.get(
-            f"{SLACK_API_BASE}/chat.getPermalink",
-            headers=self._headers,
+        response = await self._get(
+            "chat.getPermalink",
             params={"channel": channel, "message_ts": message_ts},
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def post_ephemeral(
+    async def post_ephemeral(
         self,
         channel: str,
         user: str,
@@ -559,11 +683,9 @@ def post_ephemeral(
         if blocks:
             body["blocks"] = blocks
 
-        response = httpx.post(
-            f"{SLACK_API_BASE}/chat.postEphemeral",
-            headers=self._headers,
+        response = await self._post(
+            "chat.postEphemeral",
             json=body,
-            timeout=30.0,
         )
         return self._handle_response(response)
 
@@ -571,7 +693,7 @@ def post_ephemeral(
     # Advanced Features: Views (Modals & Home Tab)
     # ============================================================
 
-    def open_modal(
+    async def open_modal(
         self,
         trigger_id: str,
         view: dict[str, Any],
@@ -582,52 +704,46 @@ def open_modal(
             trigger_id: From slash command or button interaction
             view: Modal view definition (type: "modal", title, blocks, etc.)
         """
-        response = httpx.post(
-            f"{SLACK_API_BASE}/views.open",
-            headers=self._headers,
+        response = await self._post(
+            "views.open",
             json={
                 "trigger_id": trigger_id,
                 "view": view,
             },
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def update_modal(
+    async def update_modal(
         self,
         view_id: str,
         view: dict[str, Any],
     ) -> dict[str, Any]:
         """Update an existing modal view."""
-        response = httpx.post(
-            f"{SLACK_API_BASE}/views.update",
-            headers=self._headers,
+        response = await self._post(
+            "views.update",
             json={
                 "view_id": view_id,
                 "view": view,
             },
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def push_modal(
+    async def push_modal(
         self,
         trigger_id: str,
         view: dict[str, Any],
     ) -> dict[str, Any]:
         """Push a new view onto the modal stack."""
-        response = httpx.post(
-            f"{SLACK_API_BASE}/views.push",
-            headers=self._headers,
+        response = await self._post(
+            "views.push",
             json={
                 "trigger_id": trigger_id,
                 "view": view,
             },
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def publish_home_tab(
+    async def publish_home_tab(
         self,
         user_id: str,
         view: dict[str, Any],
@@ -638,14 +754,12 @@ def publish_home_tab(
             user_id: User whose home tab to update
             view: Home tab view (type: "home", blocks)
         """
-        response = httpx.post(
-            f"{SLACK_API_BASE}/views.publish",
-            headers=self._headers,
+        response = await self._post(
+            "views.publish",
             json={
                 "user_id": user_id,
                 "view": view,
             },
-            timeout=30.0,
         )
         return self._handle_response(response)
 
@@ -653,7 +767,7 @@ def publish_home_tab(
     # Phase 2: User Status & Presence
     # ============================================================
 
-    def set_user_status(
+    async def set_user_status(
         self,
         status_text: str,
         status_emoji: str | None = None,
@@ -672,35 +786,30 @@ def set_user_status(
         if expiration is not None:
             profile["status_expiration"] = expiration
 
-        response = httpx.post(
-            f"{SLACK_API_BASE}/users.profile.set",
-            headers=self._user_headers(),
+        response = await self._post(
+            "users.profile.set",
+            headers=self._user_headers,
             json={"profile": profile},
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def set_presence(self, presence: str) -> dict[str, Any]:
+    async def set_presence(self, presence: str) -> dict[str, Any]:
         """Set user presence (auto or away).
 
         Args:
             presence: 'auto' or 'away'
         """
-        response = httpx.post(
-            f"{SLACK_API_BASE}/users.setPresence",
-            headers=self._headers,
+        response = await self._post(
+            "users.setPresence",
             json={"presence": presence},
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def get_presence(self, user_id: str) -> dict[str, Any]:
+    async def get_presence(self, user_id: str) -> dict[str, Any]:
         """Get a user's presence status."""
-        response = httpx.get(
-            f"{SLACK_API_BASE}/users.getPresence",
-            headers=self._headers,
+        response = await self._get(
+            "users.getPresence",
             params={"user": user_id},
-            timeout=30.0,
         )
         return self._handle_response(response)
 
@@ -708,7 +817,7 @@ def get_presence(self, user_id: str) -> dict[str, Any]:
     # Phase 2: Reminders
     # ============================================================
 
-    def create_reminder(
+    async def create_reminder(
         self,
         text: str,
         time: str,
@@ -725,30 +834,24 @@ def create_reminder(
         if user:
             body["user"] = user
 
-        response = httpx.post(
-            f"{SLACK_API_BASE}/reminders.add",
-            headers=self._headers,
+        response = await self._post(
+            "reminders.add",
             json=body,
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def list_reminders(self) -> dict[str, Any]:
+    async def list_reminders(self) -> dict[str, Any]:
         """List all reminders for the authenticated user."""
-        response = httpx.get(
-            f"{SLACK_API_BASE}/reminders.list",
-            headers=self._headers,
-            timeout=30.0,
+        response = await self._get(
+            "reminders.list",
         )
         return self._handle_response(response)
 
-    def delete_reminder(self, reminder_id: str) -> dict[str, Any]:
+    async def delete_reminder(self, reminder_id: str) -> dict[str, Any]:
         """Delete a reminder by ID."""
-        response = httpx.post(
-            f"{SLACK_API_BASE}/reminders.delete",
-            headers=self._headers,
+        response = await self._post(
+            "reminders.delete",
             json={"reminder": reminder_id},
-            timeout=30.0,
         )
         return self._handle_response(response)
 
@@ -756,7 +859,7 @@ def delete_reminder(self, reminder_id: str) -> dict[str, Any]:
     # Phase 2: User Groups
     # ============================================================
 
-    def create_usergroup(
+    async def create_usergroup(
         self,
         name: str,
         handle: str | None = None,
@@ -779,15 +882,13 @@ def create_usergroup(
         if channels:
             body["channels"] = ",".join(channels)
 
-        response = httpx.post(
-            f"{SLACK_API_BASE}/usergroups.create",
-            headers=self._headers,
+        response = await self._post(
+            "usergroups.create",
             json=body,
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def update_usergroup_members(
+    async def update_usergroup_members(
         self,
         usergroup_id: str,
         users: list[str],
@@ -798,24 +899,20 @@ def update_usergroup_members(
             usergroup_id: The ID of the user group
             users: List of user IDs to set as members
         """
-        response = httpx.post(
-            f"{SLACK_API_BASE}/usergroups.users.update",
-            headers=self._headers,
+        response = await self._post(
+            "usergroups.users.update",
             json={
                 "usergroup": usergroup_id,
                 "users": ",".join(users),
             },
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def list_usergroups(self) -> dict[str, Any]:
+    async def list_usergroups(self) -> dict[str, Any]:
         """List all user groups in the workspace."""
-        response = httpx.get(
-            f"{SLACK_API_BASE}/usergroups.list",
-            headers=self._headers,
+        response = await self._get(
+            "usergroups.list",
             params={"include_count": True, "include_users": True},
-            timeout=30.0,
         )
         return self._handle_response(response)
 
@@ -823,12 +920,10 @@ def list_usergroups(self) -> dict[str, Any]:
     # Phase 2: Emoji
     # ============================================================
 
-    def list_emoji(self) -> dict[str, Any]:
+    async def list_emoji(self) -> dict[str, Any]:
         """List all custom emoji in the workspace."""
-        response = httpx.get(
-            f"{SLACK_API_BASE}/emoji.list",
-            headers=self._headers,
-            timeout=30.0,
+        response = await self._get(
+            "emoji.list",
         )
         return self._handle_response(response)
 
@@ -836,7 +931,7 @@ def list_emoji(self) -> dict[str, Any]:
     # Phase 2: Canvas (Collaborative Documents)
     # ============================================================
 
-    def create_canvas(
+    async def create_canvas(
         self,
         title: str,
         document_content: dict[str, Any] | None = None,
@@ -851,15 +946,13 @@ def create_canvas(
         if document_content:
             body["document_content"] = document_content
 
-        response = httpx.post(
-            f"{SLACK_API_BASE}/canvases.create",
-            headers=self._headers,
+        response = await self._post(
+            "canvases.create",
             json=body,
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def edit_canvas(
+    async def edit_canvas(
         self,
         canvas_id: str,
         changes: list[dict[str, Any]],
@@ -870,14 +963,12 @@ def edit_canvas(
             canvas_id: The canvas document ID
             changes: List of change operations (insert_at_start, insert_at_end, etc.)
         """
-        response = httpx.post(
-            f"{SLACK_API_BASE}/canvases.edit",
-            headers=self._headers,
+        response = await self._post(
+            "canvases.edit",
             json={
                 "canvas_id": canvas_id,
                 "changes": changes,
             },
-            timeout=30.0,
         )
         return self._handle_response(response)
 
@@ -890,7 +981,7 @@ def edit_canvas(
     # unanswered questions, etc. No rule-based logic here.
     # ============================================================
 
-    def get_messages_for_analysis(
+    async def get_messages_for_analysis(
         self,
         channel: str,
         limit: int = 100,
@@ -912,7 +1003,7 @@ def get_messages_for_analysis(
             limit: Number of messages (max 100)
             include_threads: Whether to fetch thread replies for messages
         """
-        history = self.get_history(channel, limit=min(limit, 100))
+        history = await self.get_history(channel, limit=min(limit, 100))
         if "error" in history:
             return history
 
@@ -939,7 +1030,7 @@ def get_messages_for_analysis(
 
             # Optionally fetch thread replies for deeper analysis
             if include_threads and enriched_msg["reply_count"] > 0:
-                thread_data = self.get_thread_replies(channel, msg["ts"])
+                thread_data = await self.get_thread_replies(channel, msg["ts"])
                 if "messages" in thread_data:
                     enriched_msg["thread_replies"] = [
                         {"text": r.get("text", ""), "user": r.get("user")}
@@ -963,7 +1054,7 @@ def get_messages_for_analysis(
     # Phase 2: Workflow Automation
     # ============================================================
 
-    def trigger_workflow(
+    async def trigger_workflow(
         self,
         webhook_url: str,
         payload: dict[str, Any] | None = None,
@@ -976,10 +1067,9 @@ def trigger_workflow(
         """
         body = payload or {}
 
-        response = httpx.post(
+        response = await self._post(
             webhook_url,
             json=body,
-            timeout=30.0,
         )
 
         if response.status_code != 200:
@@ -991,7 +1081,7 @@ def trigger_workflow(
     # Phase 3: Critical Power Tools
     # ============================================================
 
-    def get_conversation_context(
+    async def get_conversation_context(
         self,
         channel: str,
         limit: int = 20,
@@ -1007,7 +1097,7 @@ def get_conversation_context(
             limit: Number of messages to fetch
             include_user_info: Whether to resolve user IDs to names
         """
-        history = self.get_history(channel, limit=limit)
+        history = await self.get_history(channel, limit=limit)
         if "error" in history:
             return history
 
@@ -1024,7 +1114,7 @@ def get_conversation_context(
             user_name = user_id
             if include_user_info and user_id != "unknown":
                 if user_id not in user_cache:
-                    user_info = self.get_user_info(user_id)
+                    user_info = await self.get_user_info(user_id)
                     if "user" in user_info:
                         user_cache[user_id] = user_info["user"].get("real_name", user_id)
                     else:
@@ -1048,7 +1138,7 @@ def get_conversation_context(
             "users_in_conversation": list(user_cache.values()),
         }
 
-    def find_user_by_email(
+    async def find_user_by_email(
         self,
         email: str,
     ) -> dict[str, Any]:
@@ -1060,15 +1150,13 @@ def find_user_by_email(
         Args:
             email: User's email address
         """
-        response = httpx.get(
-            f"{SLACK_API_BASE}/users.lookupByEmail",
-            headers=self._headers,
+        response = await self._get(
+            "users.lookupByEmail",
             params={"email": email},
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def kick_user_from_channel(
+    async def kick_user_from_channel(
         self,
         channel: str,
         user: str,
@@ -1079,15 +1167,13 @@ def kick_user_from_channel(
             channel: Channel ID
             user: User ID to remove
         """
-        response = httpx.post(
-            f"{SLACK_API_BASE}/conversations.kick",
-            headers=self._headers,
+        response = await self._post(
+            "conversations.kick",
             json={"channel": channel, "user": user},
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def delete_file(
+    async def delete_file(
         self,
         file_id: str,
     ) -> dict[str, Any]:
@@ -1096,34 +1182,28 @@ def delete_file(
         Args:
             file_id: The file ID to delete
         """
-        response = httpx.post(
-            f"{SLACK_API_BASE}/files.delete",
-            headers=self._headers,
+        response = await self._post(
+            "files.delete",
             json={"file": file_id},
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def get_team_stats(self) -> dict[str, Any]:
+    async def get_team_stats(self) -> dict[str, Any]:
         """Get high-level workspace statistics.
 
         Provides an overview of the team including user count
         and basic team info.
         """
         # Get team info
-        team_response = httpx.get(
-            f"{SLACK_API_BASE}/team.info",
-            headers=self._headers,
-            timeout=30.0,
+        team_response = await self._get(
+            "team.info",
         )
         team_data = self._handle_response(team_response)
 
         # Get user count
-        users_response = httpx.get(
-            f"{SLACK_API_BASE}/users.list",
-            headers=self._headers,
+        users_response = await self._get(
+            "users.list",
             params={"limit": 1},  # Just need cursor metadata
-            timeout=30.0,
         )
         users_data = self._handle_response(users_response)
 
@@ -1183,7 +1263,7 @@ def _get_client(account: str = "") -> _SlackClient | dict[str, str]:
     # --- Messages ---
 
     @mcp.tool()
-    def slack_send_message(
+    async def slack_send_message(
         channel: str,
         text: str,
         thread_ts: str | None = None,
@@ -1204,7 +1284,7 @@ def slack_send_message(
         if isinstance(client, dict):
             return client
         try:
-            result = client.post_message(channel, text, thread_ts)
+            result = await client.post_message(channel, text, thread_ts)
             if "error" in result:
                 return result
             return {
@@ -1218,10 +1298,71 @@ def slack_send_message(
         except httpx.RequestError as e:
             return {"error": f"Network error: {e}"}
 
+    @mcp.tool()
+    async def slack_send_messages(
+        messages: list[dict],
+        account: str = "",
+    ) -> dict:
+        """
+        Send several Slack messages in one call.
+
+        Messages are sent concurrently (subject to the client's request cap),
+        so posting the same update to many channels takes roughly one round
+        trip instead of one per message.
+
+        Args:
+            messages: List of messages, each a dict with "channel", "text" and
+                      optional "thread_ts" (same meaning as slack_send_message)
+
+        Returns:
+            Dict with per-message results in input order, plus sent/failed counts
+        """
+        client = _get_client(account)
+        if isinstance(client, dict):
+            return client
+        if not messages:
+            return {"error": "messages must be a non-empty list"}
+        for i, msg in enumerate(messages):
+            if not isinstance(msg, dict) or not msg.get("channel") or not msg.get("text"):
+                return {"error": f"messages[{i}] must have 'channel' and 'text'"}
+
+        outcomes = await asyncio.gather(
+            *(
+                client.post_message(msg["channel"], msg["text"], msg.get("thread_ts"))
+                for msg in messages
+            ),
+            return_exceptions=True,
+        )
+        results = []
+        for msg, outcome in zip(messages, outcomes, strict=True):
+            if isinstance(outcome, httpx.TimeoutException):
+                results.append({"channel": msg["channel"], "error": "Request timed out"})
+            elif isinstance(outcome, httpx.RequestError):
+                results.append({"channel": msg["channel"], "error": f"Network error: {outcome}"})
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            elif "error" in outcome:
+                results.append({"channel": msg["channel"], **outcome})
+            else:
+                results.append(
+                    {
+                        "success": True,
+                        "channel": outcome.get("channel"),
+                        "ts": outcome.get("ts"),
+                    }
+                )
+        failed = sum(1 for r in results if "error" in r)
+        return {
+            "success": failed == 0,
+            "results": results,
+            "sent": len(results) - failed,
+            "failed": failed,
+        }
+
     # --- Channels ---
 
     @mcp.tool()
-    def slack_list_channels(
+    async def slack_list_channels(
         types: str = "public_channel,private_channel",
         limit: int = 100,
         account: str = "",
@@ -1229,6 +1370,9 @@ def slack_list_channels(
         """
         List channels in the Slack workspace.
 
+        Follows Slack's pagination cursor until ``limit`` channels have been
+        collected or the workspace has no more.
+
         Args:
             types: Comma-separated channel types
                    (public_channel, private_channel, mpim, im)
@@ -1241,9 +1385,20 @@ def slack_list_channels(
         if isinstance(client, dict):
             return client
         try:
-            result = client.list_conversations(types, limit)
-            if "error" in result:
-                return result
+            limit = max(1, min(limit, 1000))
+            deadline = time.monotonic() + MAX_PAGINATION_TIMEOUT_SECONDS
+            raw_channels: list[dict] = []
+            cursor = None
+            while True:
+                result = await client.list_conversations(
+                    types, min(SLACK_PAGE_SIZE, limit - len(raw_channels)), cursor
+                )
+                if "error" in result:
+                    return result
+                raw_channels.extend(result.get("channels", []))
+                cursor = result.get("response_metadata", {}).get("next_cursor")
+                if not cursor or len(raw_channels) >= limit or time.monotonic() >= deadline:
+                    break
             channels = [
                 {
                     "id": ch.get("id"),
@@ -1252,12 +1407,13 @@ def slack_list_channels(
                     "num_members": ch.get("num_members", 0),
                     "topic": ch.get("topic", {}).get("value", ""),
                 }
-                for ch in result.get("channels", [])
+                for ch in raw_channels[:limit]
             ]
             return {
                 "success": True,
                 "channels": channels,
                 "count": len(channels),
+                "has_more": bool(cursor),
             }
         except httpx.TimeoutException:
             return {"error": "Request timed out"}
@@ -1267,7 +1423,7 @@ def slack_list_channels(
     # --- History ---
 
     @mcp.tool()
-    def slack_get_channel_history(
+    async def slack_get_channel_history(
         channel: str,
         limit: int = 20,
         account: str = "",
@@ -1286,7 +1442,7 @@ def slack_get_channel_history(
         if isinstance(client, dict):
             return client
         try:
-            result = client.get_history(channel, limit)
+            result = await client.get_history(channel, limit)
             if "error" in result:
                 return result
             messages = [
@@ -1312,7 +1468,7 @@ def slack_get_channel_history(
     # --- Reactions ---
 
     @mcp.tool()
-    def slack_add_reaction(
+    async def slack_add_reaction(
         channel: str,
         timestamp: str,
         emoji: str,
@@ -1333,7 +1489,7 @@ def slack_add_reaction(
         if isinstance(client, dict):
             return client
         try:
-            result = client.add_reaction(channel, timestamp, emoji)
+            result = await client.add_reaction(channel, timestamp, emoji)
             if "error" in result:
                 return result
             return {"success": True}
@@ -1345,7 +1501,7 @@ def slack_add_reaction(
     # --- Users ---
 
     @mcp.tool()
-    def slack_get_user_info(user_id: str, account: str = "") -> dict:
+    async def slack_get_user_info(user_id: str, account: str = "") -> dict:
         """
         Get information about a Slack user.
 
@@ -1359,7 +1515,7 @@ def slack_get_user_info(user_id: str, account: str = "") -> dict:
         if isinstance(client, dict):
             return client
         try:
-            result = client.get_user_info(user_id)
+            result = await client.get_user_info(user_id)
             if "error" in result:
                 return result
             user = result.get("user", {})
@@ -1385,7 +1541,7 @@ def slack_get_user_info(user_id: str, account: str = "") -> dict:
     # --- Update/Delete Messages ---
 
     @mcp.tool()
-    def slack_update_message(
+    async def slack_update_message(
         channel: str,
         ts: str,
         text: str,
@@ -1406,7 +1562,7 @@ def slack_update_message(
         if isinstance(client, dict):
             return client
         try:
-            result = client.update_message(channel, ts, text)
+            result = await client.update_message(channel, ts, text)
             if "error" in result:
                 return result
             return {
@@ -1420,7 +1576,7 @@ def slack_update_message(
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def slack_delete_message(channel: str, ts: str, account: str = "") -> dict:
+    async def slack_delete_message(channel: str, ts: str, account: str = "") -> dict:
         """
         Delete a Slack message.
 
@@ -1435,7 +1591,7 @@ def slack_delete_message(channel: str, ts: str, account: str = "") -> dict:
         if isinstance(client, dict):
             return client
         try:
-            result = client.delete_message(channel, ts)
+            result = await client.delete_message(channel, ts)
             if "error" in result:
                 return result
             return {"success": True}
@@ -1447,7 +1603,7 @@ def slack_delete_message(channel: str, ts: str, account: str = "") -> dict:
     # --- Scheduled Messages ---
 
     @mcp.tool()
-    def slack_schedule_message(
+    async def slack_schedule_message(
         channel: str,
         text: str,
         post_at: int,
@@ -1470,7 +1626,7 @@ def slack_schedule_message(
         if isinstance(client, dict):
             return client
         try:
-            result = client.schedule_message(channel, text, post_at, thread_ts)
+            result = await client.schedule_message(channel, text, post_at, thread_ts)
             if "error" in result:
                 return result
             return {
@@ -1486,7 +1642,7 @@ def slack_schedule_message(
     # --- Channel Management ---
 
     @mcp.tool()
-    def slack_create_channel(
+    async def slack_create_channel(
         name: str,
         is_private: bool = False,
         account: str = "",
@@ -1505,7 +1661,7 @@ def slack_create_channel(
         if isinstance(client, dict):
             return client
         try:
-            result = client.create_channel(name, is_private)
+            result = await client.create_channel(name, is_private)
             if "error" in result:
                 return result
             channel = result.get("channel", {})
@@ -1523,7 +1679,7 @@ def slack_create_channel(
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def slack_archive_channel(channel: str, account: str = "") -> dict:
+    async def slack_archive_channel(channel: str, account: str = "") -> dict:
         """
         Archive a Slack channel.
 
@@ -1537,7 +1693,7 @@ def slack_archive_channel(channel: str, account: str = "") -> dict:
         if isinstance(client, dict):
             return client
         try:
-            result = client.archive_channel(channel)
+            result = await client.archive_channel(channel)
             if "error" in result:
                 return result
             return {"success": True}
@@ -1547,7 +1703,7 @@ def slack_archive_channel(channel: str, account: str = "") -> dict:
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def slack_invite_to_channel(channel: str, user_ids: str, account: str = "") -> dict:
+    async def slack_invite_to_channel(channel: str, user_ids: str, account: str = "") -> dict:
         """
         Invite users to a Slack channel.
 
@@ -1562,7 +1718,7 @@ def slack_invite_to_channel(channel: str, user_ids: str, account: str = "") -> d
         if isinstance(client, dict):
             return client
         try:
-            result = client.invite_to_channel(channel, user_ids)
+            result = await client.invite_to_channel(channel, user_ids)
             if "error" in result:
                 return result
             return {"success": True}
@@ -1572,7 +1728,7 @@ def slack_invite_to_channel(channel: str, user_ids: str, account: str = "") -> d
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def slack_set_channel_topic(channel: str, topic: str, account: str = "") -> dict:
+    async def slack_set_channel_topic(channel: str, topic: str, account: str = "") -> dict:
         """
         Set the topic for a Slack channel.
 
@@ -1587,7 +1743,7 @@ def slack_set_channel_topic(channel: str, topic: str, account: str = "") -> dict
         if isinstance(client, dict):
             return client
         try:
-            result = client.set_channel_topic(channel, topic)
+            result = await client.set_channel_topic(channel, topic)
             if "error" in result:
                 return result
             return {"success": True, "topic": result.get("topic")}
@@ -1599,7 +1755,7 @@ def slack_set_channel_topic(channel: str, topic: str, account: str = "") -> dict
     # --- Reactions ---
 
     @mcp.tool()
-    def slack_remove_reaction(
+    async def slack_remove_reaction(
         channel: str,
         timestamp: str,
         emoji: str,
@@ -1620,7 +1776,7 @@ def slack_remove_reaction(
         if isinstance(client, dict):
             return client
         try:
-            result = client.remove_reaction(channel, timestamp, emoji)
+            result = await client.remove_reaction(channel, timestamp, emoji)
             if "error" in result:
                 return result
             return {"success": True}
@@ -1632,7 +1788,7 @@ def slack_remove_reaction(
     # --- Users ---
 
     @mcp.tool()
-    def slack_list_users(limit: int = 100, account: str = "") -> dict:
+    async def slack_list_users(limit: int = 100, account: str = "") -> dict:
         """
         List users in the Slack workspace.
 
@@ -1646,7 +1802,7 @@ def slack_list_users(limit: int = 100, account: str = "") -> dict:
         if isinstance(client, dict):
             return client
         try:
-            result = client.list_users(limit)
+            result = await client.list_users(limit)
             if "error" in result:
                 return result
             users = [
@@ -1673,7 +1829,7 @@ def slack_list_users(limit: int = 100, account: str = "") -> dict:
     # --- Files ---
 
     @mcp.tool()
-    def slack_upload_file(
+    async def slack_upload_file(
         channel: str,
         content: str,
         filename: str,
@@ -1698,7 +1854,7 @@ def slack_upload_file(
         if isinstance(client, dict):
             return client
         try:
-            result = client.upload_file(channel, content, filename, title, comment)
+            result = await client.upload_file(channel, content, filename, title, comment)
             if "error" in result:
                 return result
             file_info = result.get("file", {})
@@ -1719,7 +1875,7 @@ def slack_upload_file(
     # --- Search ---
 
     @mcp.tool()
-    def slack_search_messages(
+    async def slack_search_messages(
         query: str,
         count: int = 20,
         account: str = "",
@@ -1738,7 +1894,7 @@ def slack_search_messages(
         if isinstance(client, dict):
             return client
         try:
-            result = client.search_messages(query, count)
+            result = await client.search_messages(query, count)
             if "error" in result:
                 return result
             messages = result.get("messages", {})
@@ -1765,7 +1921,7 @@ def slack_search_messages(
     # --- Threads ---
 
     @mcp.tool()
-    def slack_get_thread_replies(
+    async def slack_get_thread_replies(
         channel: str,
         thread_ts: str,
         limit: int = 50,
@@ -1786,7 +1942,7 @@ def slack_get_thread_replies(
         if isinstance(client, dict):
             return client
         try:
-            result = client.get_thread_replies(channel, thread_ts, limit)
+            result = await client.get_thread_replies(channel, thread_ts, limit)
             if "error" in result:
                 return result
             messages = [
@@ -1810,7 +1966,7 @@ def slack_get_thread_replies(
     # --- Pins ---
 
     @mcp.tool()
-    def slack_pin_message(channel: str, timestamp: str, account: str = "") -> dict:
+    async def slack_pin_message(channel: str, timestamp: str, account: str = "") -> dict:
         """
         Pin a message to a channel.
 
@@ -1825,7 +1981,7 @@ def slack_pin_message(channel: str, timestamp: str, account: str = "") -> dict:
         if isinstance(client, dict):
             return client
         try:
-            result = client.pin_message(channel, timestamp)
+            result = await client.pin_message(channel, timestamp)
             if "error" in result:
                 return result
             return {"success": True}
@@ -1835,7 +1991,7 @@ def slack_pin_message(channel: str, timestamp: str, account: str = "") -> dict:
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def slack_unpin_message(channel: str, timestamp: str, account: str = "") -> dict:
+    async def slack_unpin_message(channel: str, timestamp: str, account: str = "") -> dict:
         """
         Unpin a message from a channel.
 
@@ -1850,7 +2006,7 @@ def slack_unpin_message(channel: str, timestamp: str, account: str = "") -> dict
         if isinstance(client, dict):
             return client
         try:
-            result = client.unpin_message(channel, timestamp)
+            result = await client.unpin_message(channel, timestamp)
             if "error" in result:
                 return result
             return {"success": True}
@@ -1860,7 +2016,7 @@ def slack_unpin_message(channel: str, timestamp: str, account: str = "") -> dict
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def slack_list_pins(channel: str, account: str = "") -> dict:
+    async def slack_list_pins(channel: str, account: str = "") -> dict:
         """
         List all pinned items in a channel.
 
@@ -1874,7 +2030,7 @@ def slack_list_pins(channel: str, account: str = "") -> dict:
         if isinstance(client, dict):
             return client
         try:
-            result = client.list_pins(channel)
+            result = await client.list_pins(channel)
             if "error" in result:
                 return result
             items = result.get("items", [])
@@ -1898,7 +2054,7 @@ def slack_list_pins(channel: str, account: str = "") -> dict:
     # --- Bookmarks ---
 
     @mcp.tool()
-    def slack_add_bookmark(
+    async def slack_add_bookmark(
         channel: str,
         title: str,
         link: str,
@@ -1921,7 +2077,7 @@ def slack_add_bookmark(
         if isinstance(client, dict):
             return client
         try:
-            result = client.add_bookmark(channel, title, link, emoji)
+            result = await client.add_bookmark(channel, title, link, emoji)
             if "error" in result:
                 return result
             bookmark = result.get("bookmark", {})
@@ -1941,7 +2097,7 @@ def slack_add_bookmark(
     # --- Scheduled Messages Management ---
 
     @mcp.tool()
-    def slack_list_scheduled_messages(channel: str | None = None, account: str = "") -> dict:
+    async def slack_list_scheduled_messages(channel: str | None = None, account: str = "") -> dict:
         """
         List all scheduled messages.
 
@@ -1955,7 +2111,7 @@ def slack_list_scheduled_messages(channel: str | None = None, account: str = "")
         if isinstance(client, dict):
             return client
         try:
-            result = client.list_scheduled_messages(channel)
+            result = await client.list_scheduled_messages(channel)
             if "error" in result:
                 return result
             messages = result.get("scheduled_messages", [])
@@ -1978,7 +2134,7 @@ def slack_list_scheduled_messages(channel: str | None = None, account: str = "")
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def slack_delete_scheduled_message(
+    async def slack_delete_scheduled_message(
         channel: str,
         scheduled_message_id: str,
         account: str = "",
@@ -1997,7 +2153,7 @@ def slack_delete_scheduled_message(
         if isinstance(client, dict):
             return client
         try:
-            result = client.delete_scheduled_message(channel, scheduled_message_id)
+            result = await client.delete_scheduled_message(channel, scheduled_message_id)
             if "error" in result:
                 return result
             return {"success": True}
@@ -2009,7 +2165,7 @@ def slack_delete_scheduled_message(
     # --- Direct Messages ---
 
     @mcp.tool()
-    def slack_send_dm(user_id: str, text: str, account: str = "") -> dict:
+    async def slack_send_dm(user_id: str, text: str, account: str = "") -> dict:
         """
         Send a direct message to a user.
 
@@ -2025,7 +2181,7 @@ def slack_send_dm(user_id: str, text: str, account: str = "") -> dict:
             return client
         try:
             # First open/get DM channel
-            dm_result = client.open_dm(user_id)
+            dm_result = await client.open_dm(user_id)
             if "error" in dm_result:
                 return dm_result
             channel_id = dm_result.get("channel", {}).get("id")
@@ -2033,7 +2189,7 @@ def slack_send_dm(user_id: str, text: str, account: str = "") -> dict:
                 return {"error": "Failed to open DM channel"}
 
             # Now send message
-            result = client.post_message(channel_id, text)
+            result = await client.post_message(channel_id, text)
             if "error" in result:
                 return result
             return {
@@ -2049,7 +2205,7 @@ def slack_send_dm(user_id: str, text: str, account: str = "") -> dict:
     # --- Message Utilities ---
 
     @mcp.tool()
-    def slack_get_permalink(channel: str, message_ts: str, account: str = "") -> dict:
+    async def slack_get_permalink(channel: str, message_ts: str, account: str = "") -> dict:
         """
         Get a permanent link to a message.
 
@@ -2064,7 +2220,7 @@ def slack_get_permalink(channel: str, message_ts: str, account: str = "") -> dic
         if isinstance(client, dict):
             return client
         try:
-            result = client.get_permalink(channel, message_ts)
+            result = await client.get_permalink(channel, message_ts)
             if "error" in result:
                 return result
             return {
@@ -2077,7 +2233,7 @@ def slack_get_permalink(channel: str, message_ts: str, account: str = "") -> dic
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def slack_send_ephemeral(
+    async def slack_send_ephemeral(
         channel: str,
         user_id: str,
         text: str,
@@ -2098,7 +2254,7 @@ def slack_send_ephemeral(
         if isinstance(client, dict):
             return client
         try:
-            result = client.post_ephemeral(channel, user_id, text)
+            result = await client.post_ephemeral(channel, user_id, text)
             if "error" in result:
                 return result
             return {
@@ -2115,7 +2271,7 @@ def slack_send_ephemeral(
     # ==========================================================================
 
     @mcp.tool()
-    def slack_post_blocks(
+    async def slack_post_blocks(
         channel: str,
         blocks: str,
         text: str = "Message with blocks",
@@ -2137,19 +2293,17 @@ def slack_post_blocks(
         Example blocks (JSON string):
             '[{"type": "section", "text": {"type": "mrkdwn", "text": "*Hello* world"}}]'
         """
-        import json as json_module
-
         client = _get_client(account)
         if isinstance(client, dict):
             return client
         try:
             # Parse blocks JSON
             try:
-                blocks_list = json_module.loads(blocks)
-            except json_module.JSONDecodeError as e:
+                blocks_list = json.loads(blocks)
+            except json.JSONDecodeError as e:
                 return {"error": f"Invalid blocks JSON: {e}"}
 
-            result = client.post_message(channel, text, thread_ts, blocks=blocks_list)
+            result = await client.post_message(channel, text, thread_ts, blocks=blocks_list)
             if "error" in result:
                 return result
             return {
@@ -2163,7 +2317,7 @@ def slack_post_blocks(
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def slack_open_modal(
+    async def slack_open_modal(
         trigger_id: str,
         title: str,
         blocks: str,
@@ -2186,15 +2340,13 @@ def slack_open_modal(
         Returns:
             Dict with view ID or error
         """
-        import json as json_module
-
         client = _get_client(account)
         if isinstance(client, dict):
             return client
         try:
             try:
-                blocks_list = json_module.loads(blocks)
-            except json_module.JSONDecodeError as e:
+                blocks_list = json.loads(blocks)
+            except json.JSONDecodeError as e:
                 return {"error": f"Invalid blocks JSON: {e}"}
 
             view = {
@@ -2207,7 +2359,7 @@ def slack_open_modal(
             if callback_id:
                 view["callback_id"] = callback_id
 
-            result = client.open_modal(trigger_id, view)
+            result = await client.open_modal(trigger_id, view)
             if "error" in result:
                 return result
             return {
@@ -2220,7 +2372,7 @@ def slack_open_modal(
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def slack_update_home_tab(
+    async def slack_update_home_tab(
         user_id: str,
         blocks: str,
         account: str = "",
@@ -2235,15 +2387,13 @@ def slack_update_home_tab(
         Returns:
             Dict with success status or error
         """
-        import json as json_module
-
         client = _get_client(account)
         if isinstance(client, dict):
             return client
         try:
             try:
-                blocks_list = json_module.loads(blocks)
-            except json_module.JSONDecodeError as e:
+                blocks_list = json.loads(blocks)
+            except json.JSONDecodeError as e:
                 return {"error": f"Invalid blocks JSON: {e}"}
 
             view = {
@@ -2251,7 +2401,7 @@ def slack_update_home_tab(
                 "blocks": blocks_list,
             }
 
-            result = client.publish_home_tab(user_id, view)
+            result = await client.publish_home_tab(user_id, view)
             if "error" in result:
                 return result
             return {
@@ -2268,7 +2418,7 @@ def slack_update_home_tab(
     # =========================================================================
 
     @mcp.tool()
-    def slack_set_status(
+    async def slack_set_status(
         status_text: str,
         status_emoji: str | None = None,
         expiration_minutes: int | None = None,
@@ -2289,13 +2439,11 @@ def slack_set_status(
         if isinstance(client, dict):
             return client
         try:
-            import time
-
             expiration = None
             if expiration_minutes is not None and expiration_minutes > 0:
                 expiration = int(time.time()) + (expiration_minutes * 60)
 
-            result = client.set_user_status(status_text, status_emoji, expiration)
+            result = await client.set_user_status(status_text, status_emoji, expiration)
             if "error" in result:
                 return result
             return {
@@ -2309,7 +2457,7 @@ def slack_set_status(
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def slack_set_presence(presence: str, account: str = "") -> dict:
+    async def slack_set_presence(presence: str, account: str = "") -> dict:
         """
         Set the bot's presence status.
 
@@ -2325,7 +2473,7 @@ def slack_set_presence(presence: str, account: str = "") -> dict:
         if presence not in ("auto", "away"):
             return {"error": "presence must be 'auto' or 'away'"}
         try:
-            result = client.set_presence(presence)
+            result = await client.set_presence(presence)
             if "error" in result:
                 return result
             return {"success": True, "presence": presence}
@@ -2335,7 +2483,7 @@ def slack_set_presence(presence: str, account: str = "") -> dict:
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def slack_get_presence(user_id: str, account: str = "") -> dict:
+    async def slack_get_presence(user_id: str, account: str = "") -> dict:
         """
         Get a user's current presence status.
 
@@ -2349,7 +2497,7 @@ def slack_get_presence(user_id: str, account: str = "") -> dict:
         if isinstance(client, dict):
             return client
         try:
-            result = client.get_presence(user_id)
+            result = await client.get_presence(user_id)
             if "error" in result:
                 return result
             return {
@@ -2368,7 +2516,7 @@ def slack_get_presence(user_id: str, account: str = "") -> dict:
     # =========================================================================
 
     @mcp.tool()
-    def slack_create_reminder(
+    async def slack_create_reminder(
         text: str,
         time: str,
         user_id: str | None = None,
@@ -2389,7 +2537,7 @@ def slack_create_reminder(
         if isinstance(client, dict):
             return client
         try:
-            result = client.create_reminder(text, time, user_id)
+            result = await client.create_reminder(text, time, user_id)
             if "error" in result:
                 return result
             reminder = result.get("reminder", {})
@@ -2405,7 +2553,7 @@ def slack_create_reminder(
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def slack_list_reminders(account: str = "") -> dict:
+    async def slack_list_reminders(account: str = "") -> dict:
         """
         List all pending reminders for the authenticated user.
 
@@ -2416,7 +2564,7 @@ def slack_list_reminders(account: str = "") -> dict:
         if isinstance(client, dict):
             return client
         try:
-            result = client.list_reminders()
+            result = await client.list_reminders()
             if "error" in result:
                 return result
             reminders = result.get("reminders", [])
@@ -2438,7 +2586,7 @@ def slack_list_reminders(account: str = "") -> dict:
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def slack_delete_reminder(reminder_id: str, account: str = "") -> dict:
+    async def slack_delete_reminder(reminder_id: str, account: str = "") -> dict:
         """
         Delete/cancel a reminder.
 
@@ -2452,7 +2600,7 @@ def slack_delete_reminder(reminder_id: str, account: str = "") -> dict:
         if isinstance(client, dict):
             return client
         try:
-            result = client.delete_reminder(reminder_id)
+            result = await client.delete_reminder(reminder_id)
             if "error" in result:
                 return result
             return {"success": True, "deleted": reminder_id}
@@ -2466,7 +2614,7 @@ def slack_delete_reminder(reminder_id: str, account: str = "") -> dict:
     # =========================================================================
 
     @mcp.tool()
-    def slack_create_usergroup(
+    async def slack_create_usergroup(
         name: str,
         handle: str | None = None,
         description: str | None = None,
@@ -2487,7 +2635,7 @@ def slack_create_usergroup(
         if isinstance(client, dict):
             return client
         try:
-            result = client.create_usergroup(name, handle, description)
+            result = await client.create_usergroup(name, handle, description)
             if "error" in result:
                 return result
             ug = result.get("usergroup", {})
@@ -2503,7 +2651,7 @@ def slack_create_usergroup(
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def slack_update_usergroup_members(
+    async def slack_update_usergroup_members(
         usergroup_id: str,
         user_ids: str,
         account: str = "",
@@ -2523,7 +2671,7 @@ def slack_update_usergroup_members(
             return client
         try:
             users = [u.strip() for u in user_ids.split(",") if u.strip()]
-            result = client.update_usergroup_members(usergroup_id, users)
+            result = await client.update_usergroup_members(usergroup_id, users)
             if "error" in result:
                 return result
             return {
@@ -2537,7 +2685,7 @@ def slack_update_usergroup_members(
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def slack_list_usergroups(account: str = "") -> dict:
+    async def slack_list_usergroups(account: str = "") -> dict:
         """
         List all user groups in the workspace.
 
@@ -2548,7 +2696,7 @@ def slack_list_usergroups(account: str = "") -> dict:
         if isinstance(client, dict):
             return client
         try:
-            result = client.list_usergroups()
+            result = await client.list_usergroups()
             if "error" in result:
                 return result
             groups = result.get("usergroups", [])
@@ -2574,7 +2722,7 @@ def slack_list_usergroups(account: str = "") -> dict:
     # =========================================================================
 
     @mcp.tool()
-    def slack_list_emoji(account: str = "") -> dict:
+    async def slack_list_emoji(account: str = "") -> dict:
         """
         List all custom emoji in the workspace.
 
@@ -2585,7 +2733,7 @@ def slack_list_emoji(account: str = "") -> dict:
         if isinstance(client, dict):
             return client
         try:
-            result = client.list_emoji()
+            result = await client.list_emoji()
             if "error" in result:
                 return result
             emoji = result.get("emoji", {})
@@ -2604,7 +2752,7 @@ def slack_list_emoji(account: str = "") -> dict:
     # =========================================================================
 
     @mcp.tool()
-    def slack_create_canvas(
+    async def slack_create_canvas(
         title: str,
         markdown_content: str | None = None,
         account: str = "",
@@ -2630,7 +2778,7 @@ def slack_create_canvas(
                     "markdown": markdown_content,
                 }
 
-            result = client.create_canvas(title, doc_content)
+            result = await client.create_canvas(title, doc_content)
             if "error" in result:
                 return result
             return {
@@ -2644,7 +2792,7 @@ def slack_create_canvas(
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def slack_edit_canvas(
+    async def slack_edit_canvas(
         canvas_id: str,
         markdown_content: str,
         operation: str = "insert_at_end",
@@ -2675,7 +2823,7 @@ def slack_edit_canvas(
                 }
             ]
 
-            result = client.edit_canvas(canvas_id, changes)
+            result = await client.edit_canvas(canvas_id, changes)
             if "error" in result:
                 return result
             return {
@@ -2698,7 +2846,7 @@ def slack_edit_canvas(
     # =========================================================================
 
     @mcp.tool()
-    def slack_get_messages_for_analysis(
+    async def slack_get_messages_for_analysis(
         channel: str,
         limit: int = 100,
         include_threads: bool = True,
@@ -2728,7 +2876,7 @@ def slack_get_messages_for_analysis(
         if isinstance(client, dict):
             return client
         try:
-            return client.get_messages_for_analysis(channel, limit, include_threads)
+            return await client.get_messages_for_analysis(channel, limit, include_threads)
         except httpx.TimeoutException:
             return {"error": "Request timed out"}
         except httpx.RequestError as e:
@@ -2739,7 +2887,7 @@ def slack_get_messages_for_analysis(
     # =========================================================================
 
     @mcp.tool()
-    def slack_trigger_workflow(
+    async def slack_trigger_workflow(
         webhook_url: str,
         payload: str | None = None,
         account: str = "",
@@ -2754,8 +2902,6 @@ def slack_trigger_workflow(
         Returns:
             Dict with success status or error
         """
-        import json as json_module
-
         client = _get_client(account)
         if isinstance(client, dict):
             return client
@@ -2763,11 +2909,11 @@ def slack_trigger_workflow(
             payload_dict = None
             if payload:
                 try:
-                    payload_dict = json_module.loads(payload)
-                except json_module.JSONDecodeError as e:
+                    payload_dict = json.loads(payload)
+                except json.JSONDecodeError as e:
                     return {"error": f"Invalid payload JSON: {e}"}
 
-            return client.trigger_workflow(webhook_url, payload_dict)
+            return await client.trigger_workflow(webhook_url, payload_dict)
         except httpx.TimeoutException:
             return {"error": "Request timed out"}
         except httpx.RequestError as e:
@@ -2778,7 +2924,7 @@ def slack_trigger_workflow(
     # =========================================================================
 
     @mcp.tool()
-    def slack_get_conversation_context(
+    async def slack_get_conversation_context(
         channel: str,
         limit: int = 20,
         include_user_info: bool = True,
@@ -2802,14 +2948,14 @@ def slack_get_conversation_context(
         if isinstance(client, dict):
             return client
         try:
-            return client.get_conversation_context(channel, limit, include_user_info)
+            return await client.get_conversation_context(channel, limit, include_user_info)
         except httpx.TimeoutException:
             return {"error": "Request timed out"}
         except httpx.RequestError as e:
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def slack_find_user_by_email(
+    async def slack_find_user_by_email(
         email: str,
         account: str = "",
     ) -> dict:
@@ -2829,14 +2975,14 @@ def slack_find_user_by_email(
         if isinstance(client, dict):
             return client
         try:
-            return client.find_user_by_email(email)
+            return await client.find_user_by_email(email)
         except httpx.TimeoutException:
             return {"error": "Request timed out"}
         except httpx.RequestError as e:
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def slack_kick_user_from_channel(
+    async def slack_kick_user_from_channel(
         channel: str,
         user: str,
         account: str = "",
@@ -2857,14 +3003,14 @@ def slack_kick_user_from_channel(
         if isinstance(client, dict):
             return client
         try:
-            return client.kick_user_from_channel(channel, user)
+            return await client.kick_user_from_channel(channel, user)
         except httpx.TimeoutException:
             return {"error": "Request timed out"}
         except httpx.RequestError as e:
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def slack_delete_file(
+    async def slack_delete_file(
         file_id: str,
         account: str = "",
     ) -> dict:
@@ -2883,14 +3029,14 @@ def slack_delete_file(
         if isinstance(client, dict):
             return client
         try:
-            return client.delete_file(file_id)
+            return await client.delete_file(file_id)
         except httpx.TimeoutException:
             return {"error": "Request timed out"}
         except httpx.RequestError as e:
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def slack_get_team_stats(account: str = "") -> dict:
+    async def slack_get_team_stats(account: str = "") -> dict:
         """
         Get high-level workspace statistics.
 
@@ -2903,7 +3049,7 @@ def slack_get_team_stats(account: str = "") -> dict:
         if isinstance(client, dict):
             return client
         try:
-            return client.get_team_stats()
+            return await client.get_team_stats()
         except httpx.TimeoutException:
             return {"error": "Request timed out"}
         except httpx.RequestError as e:
@@ -7,6 +7,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import importlib
 import inspect
 
@@ -47,6 +48,14 @@ def _find_module_for_tool(tool_name: str) -> str | None:
     return None
 
 
+def _call(fn, **kwargs):
+    """Call a tool function, running it to completion if it is async."""
+    result = fn(**kwargs)
+    if inspect.isawaitable(result):
+        result = asyncio.run(result)
+    return result
+
+
 def _register_and_get_fn(tool_name: str):
     """Register the tool's module and return the tool function."""
     # Find the module that provides this tool
@@ -112,7 +121,7 @@ def test_missing_credentials_returns_error_and_help(
         fn = _register_and_get_fn(tool_name)
         args = get_minimal_args(fn)
 
-        result = fn(**args)
+        result = _call(fn, **args)
 
         assert isinstance(result, dict), (
             f"Tool '{tool_name}' should return a dict, got {type(result)}"
@@ -160,7 +169,7 @@ def test_missing_required_params_returns_error(
 
         # Calling with no args should fail
         try:
-            result = fn()
+            result = _call(fn)
             # If it returns (doesn't raise), it should be an error dict
             if isinstance(result, dict):
                 assert "error" in result, (